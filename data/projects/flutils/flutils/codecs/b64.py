@@ -1,6 +1,9 @@
-import base64
 import codecs
-from binascii import Error
+from binascii import (
+    Error,
+    a2b_base64,
+    b2a_base64,
+)
 from collections import UserString
 from typing import ByteString as _ByteString
 from typing import (
@@ -47,7 +50,7 @@ def encode(
     # Convert the cleaned text into utf8 bytes
     text_bytes = text_str.encode('utf-8')
     try:
-        out = base64.decodebytes(text_bytes)
+        out = a2b_base64(text_bytes)
     except Error as e:
         raise UnicodeEncodeError(
             'b64',
@@ -80,11 +83,10 @@ def decode(
         str: of base64 Characters
         int: the number of the given ``data`` bytes consumed.
     """
-    # Convert memoryview and bytearray objects to bytes.
-    data_bytes = bytes(data)
-
-    # Encode the 'data_bytes' into base64 bytes.
-    encoded_bytes = base64.b64encode(data_bytes)
+    # Encode the 'data' into base64 bytes.  Only a non-bytes 'data'
+    # (e.g. bytearray or memoryview) is copied into bytes first.
+    data_bytes = data if isinstance(data, bytes) else bytes(data)
+    encoded_bytes = b2a_base64(data_bytes, newline=False)
 
     # Decode the 'base64_bytes' as utf8 into a string.
     encoded_str = encoded_bytes.decode('utf-8')
@@ -1,9 +1,7 @@
 import codecs
 from collections import UserString
-from functools import reduce
 from typing import ByteString as _ByteString
 from typing import (
-    Generator,
     Optional,
     Tuple,
     Union,
@@ -13,15 +11,26 @@ from typing import (
 _Str = Union[str, UserString]
 
 
-def _each_utf8_hex(text: _Str) -> Generator[str, None, None]:
-    for char in text:
-        if ord(char) < 128 and char.isprintable():
-            yield char
-            continue
-        utf8_bytes = char.encode('utf8')
-        for utf8_byte in utf8_bytes:
-            str_hex = '\\%s' % hex(utf8_byte)[1:]
-            yield str_hex
+def _as_utf8_hex(char: str) -> str:
+    if ord(char) < 128 and char.isprintable():
+        return char
+    return ''.join(
+        '\\%s' % hex(utf8_byte)[1:] for utf8_byte in char.encode('utf8')
+    )
+
+
+class _Utf8HexTable(dict):
+    """A :obj:`str.translate` table of the escaped utf8 hexadecimal of
+    each code point; which is added as it's first used.
+    """
+
+    def __missing__(self, code_point: int) -> str:
+        out = _as_utf8_hex(chr(code_point))
+        self[code_point] = out
+        return out
+
+
+_UTF8_HEX_TABLE = _Utf8HexTable((i, _as_utf8_hex(chr(i))) for i in range(128))
 
 
 def encode(
@@ -81,7 +90,7 @@ def encode(
         )
 
     # Convert each character into a string of escaped utf8 hexadecimal.
-    out_str: str = reduce(lambda a, b: f'{a}{b}', _each_utf8_hex(text_str))
+    out_str = text_str.translate(_UTF8_HEX_TABLE)
 
     out_bytes = out_str.encode('utf-8')
 
@@ -41,8 +41,9 @@ _STRIPPED_DUNDERS = (
     'version'
 )
 
-_DUNDERS = tuple(('__%s__' % x for x in _STRIPPED_DUNDERS))
-_BUILTIN_NAMES = tuple(filter(
+# Frozensets are used for constant time membership tests.
+_DUNDERS = frozenset(('__%s__' % x for x in _STRIPPED_DUNDERS))
+_BUILTIN_NAMES = frozenset(filter(
     lambda x: x.startswith('__') and x.endswith('__'),
     dir('__builtins__')
 ))
@@ -56,29 +57,23 @@ def _validate_attr_identifier(
     if identifier == '':
         return identifier
 
-    error: str = ''
-    # Test if the given 'identifier' is valid to be
-    # used as an identifier.
-    is_valid: bool = identifier.isidentifier()
-
-    if is_valid is True and keyword.iskeyword(identifier):
-        is_valid = False
+    # The set lookups are done before the isidentifier() scan.  Keywords,
+    # builtin names and special dunders are all valid identifiers; so, the
+    # order does not change which error is raised.
+    if keyword.iskeyword(identifier):
         error = ' Cannot be a keyword.'
-
-    if is_valid is True and identifier in _BUILTIN_NAMES:
-        is_valid = False
+    elif identifier in _BUILTIN_NAMES:
         error = ' Cannot be a builtin name.'
-
-    if is_valid is True and identifier in _DUNDERS:
-        is_valid = False
+    elif identifier in _DUNDERS:
         error = ' Cannot be a special dunder.'
-
-    if is_valid is False:
-        raise AttributeError(
-            f"__attr_map__ contains an invalid item of: {line!r}. "
-            f"The identifier, {identifier!r}, is invalid.{error}"
-        )
-    return identifier
+    elif identifier.isidentifier():
+        return identifier
+    else:
+        error = ''
+    raise AttributeError(
+        f"__attr_map__ contains an invalid item of: {line!r}. "
+        f"The identifier, {identifier!r}, is invalid.{error}"
+    )
 
 
 class _AttrMapping(NamedTuple):
@@ -6,10 +6,17 @@ from collections.abc import (
     Mapping,
     Sequence,
 )
-from functools import singledispatch
+from functools import (
+    lru_cache,
+    singledispatch,
+)
+from operator import itemgetter
 from types import SimpleNamespace
 from typing import (
     Any,
+    Callable,
+    Iterable,
+    Iterator,
     List,
     NamedTuple,
     Tuple,
@@ -29,6 +36,7 @@ _AllowedTypes = Union[
 ]
 
 
+
 def to_namedtuple(obj: _AllowedTypes) -> Union[NamedTuple, Tuple, List]:
     """Convert particular objects into a namedtuple.
 
@@ -67,6 +75,7 @@ def to_namedtuple(obj: _AllowedTypes) -> Union[NamedTuple, Tuple, List]:
     contains another dictionary, as one of it's values, will be converted
     to a :obj:`NamedTuple <collections.namedtuple>` with the attribute's
     value also converted to a :obj:`NamedTuple <collections.namedtuple>`.
+    A :obj:`ValueError` is raised if the given ``obj`` contains itself.
 
     :rtype:
         :obj:`list`
@@ -90,12 +99,91 @@ def to_namedtuple(obj: _AllowedTypes) -> Union[NamedTuple, Tuple, List]:
     return _to_namedtuple(obj)
 
 
-@singledispatch
+# noinspection Mypy
+@lru_cache(maxsize=256)
+def _make_nt(fields: Tuple[str, ...]) -> Callable[..., Tuple[Any, ...]]:
+    """Return the (cached) NamedTuple class for the given ``fields``."""
+    return namedtuple('NamedTuple', fields)  # type: ignore[misc]
+
+
+# The fieldless NamedTuple is immutable, so a single shared instance
+# is returned for every empty conversion.
+_EMPTY_NAMEDTUPLE: Tuple[Any, ...] = _make_nt(())()
+
+
+def _is_field_name(key: Any) -> bool:
+    """Return :obj:`True` if the given mapping ``key`` can be used as a
+    NamedTuple attribute.
+    """
+    if not hasattr(key, 'capitalize'):
+        return False
+    try:
+        validate_identifier(key, allow_underscore=False)
+    except SyntaxError:
+        return False
+    return key.isidentifier()
+
+
+class _Node(NamedTuple):
+    """A container whose ``children`` must be converted before the
+    container itself can be rebuilt with ``build``.
+    """
+    children: Iterable[Any]
+    build: Callable[[List[Any]], Any]
+
+
 def _to_namedtuple(
         obj: Any,
         _started: bool = False
 ) -> Any:
-    if _started is False:
+    # Walk the given obj depth-first with an explicit stack, instead of
+    # recursing, so deeply nested objects do not hit the recursion limit.
+    # Each stack entry holds the node being built, an iterator over its
+    # (unconverted) children and the list of its converted children.
+    root = _expand(obj, _started)
+    if not isinstance(root, _Node):
+        return root
+    stack: List[Tuple[_Node, Iterator[Any], List[Any], int]] = [
+        (root, iter(root.children), [], id(obj))
+    ]
+    # The ids of the containers currently being expanded.  Finding one
+    # of them again means the given obj contains itself.
+    active = {id(obj)}
+    # Bind the callables used in the loop to locals to avoid the repeated
+    # global and attribute lookups.
+    expand = _expand
+    push = stack.append
+    pop = stack.pop
+    while True:
+        node, children, args, _ = stack[-1]
+        append = args.append
+        for child in children:
+            val = expand(child, True)
+            if isinstance(val, _Node):
+                child_id = id(child)
+                if child_id in active:
+                    raise ValueError(
+                        'Cannot convert a self-referencing %r to a '
+                        'NamedTuple.' % type(child).__name__
+                    )
+                active.add(child_id)
+                push((val, iter(val.children), [], child_id))
+                break
+            append(val)
+        else:
+            active.discard(pop()[3])
+            out = node.build(args)
+            if not stack:
+                return out
+            stack[-1][2].append(out)
+
+
+@singledispatch
+def _expand(
+        obj: Any,
+        _started: bool = False
+) -> Any:
+    if not _started:
         raise TypeError(
             "Can convert only 'list', 'tuple', 'dict' to a NamedTuple; "
             "got: (%r) %s" % (type(obj).__name__, obj)
@@ -104,83 +192,64 @@ def _to_namedtuple(
 
 
 # noinspection PyUnusedFunction,Mypy
-@_to_namedtuple.register(Mapping)
+@_expand.register(Mapping)
 def _(
         obj: Mapping,
         _started: bool = False
-) -> Union[NamedTuple, Tuple]:
-    keys = []
-    for key in obj.keys():
-        if hasattr(key, 'capitalize'):
-            key = cast(str, key)
-            try:
-                validate_identifier(key, allow_underscore=False)
-            except SyntaxError:
-                continue
-            if key.isidentifier():
-                keys.append(key)
-    if not isinstance(obj, OrderedDict):
-        keys = tuple(sorted(keys))
-    args = []
-    for key in keys:
-        val: Any = obj[key]
-        val = _to_namedtuple(val, _started=True)
-        args.append(val)
-    if args:
-        # noinspection Mypy
-        make = namedtuple('NamedTuple', keys)  # type: ignore[misc]
-        # noinspection PyTypeChecker,PyArgumentList
-        out: NamedTuple = make(*args)
-        return out
-    make_empty = namedtuple('NamedTuple', '')
-    out = make_empty()
-    return out
+) -> Union[_Node, Tuple[Any, ...]]:
+    if isinstance(obj, OrderedDict):
+        keys = [key for key in obj if _is_field_name(key)]
+    else:
+        keys = sorted(key for key in obj if _is_field_name(key))
+    if not keys:
+        return _EMPTY_NAMEDTUPLE
+    make = _make_nt(tuple(keys))
+    if len(keys) > 1:
+        # Fetch all of the values with a single C-level call.
+        values = itemgetter(*keys)(obj)
+    else:
+        values = (obj[keys[0]],)
+    return _Node(values, lambda args: make(*args))
 
 
 # noinspection PyUnusedFunction,PyProtectedMember,Mypy
-@_to_namedtuple.register(Sequence)  # type: ignore[no-redef]
+@_expand.register(Sequence)  # type: ignore[no-redef]
 def _(
         obj: Sequence,
         _started: bool = False
-) -> Union[List[Any], Tuple[Any, ...], NamedTuple, str]:
+) -> Union[_Node, NamedTuple, str]:
+    # Plain lists and tuples (e.g. decoded JSON) can be neither strings
+    # nor NamedTuples, so skip probing them for attributes.
+    obj_type = type(obj)
+    if obj_type is list or obj_type is tuple:
+        return _Node(obj, obj_type)
     if hasattr(obj, 'capitalize'):
         obj = cast(str, obj)
-        if _started is False:
+        if not _started:
             raise TypeError(
                 "Can convert only 'list', 'tuple', 'dict' to a NamedTuple; "
                 "got: (%r) %s" % (type(obj).__name__, obj)
             )
         return obj
     if hasattr(obj, '_fields'):
-        fields: List[str] = list(obj._fields)
+        fields: Tuple[str, ...] = tuple(obj._fields)
         if fields:
             obj = cast(NamedTuple, obj)
-            args = []
-            for attr in obj._fields:
-                val: Any = getattr(obj, attr)
-                val = _to_namedtuple(val, _started=True)
-                args.append(val)
-            if args:
-                # noinspection Mypy
-                make = namedtuple('NamedTuple', fields)  # type: ignore[misc]
-                # noinspection PyTypeChecker,PyArgumentList
-                out: NamedTuple = make(*args)
-                return out
+            make = _make_nt(fields)
+            return _Node(
+                [getattr(obj, attr) for attr in fields],
+                lambda args: make(*args)
+            )
         return obj
-    # noinspection PyTypeChecker
-    out = []
-    for item in obj:
-        val = _to_namedtuple(item, _started=True)
-        out.append(val)
     if not hasattr(obj, 'append'):
-        return tuple(out)
-    return out
+        return _Node(obj, tuple)
+    return _Node(obj, list)
 
 
 # noinspection PyUnusedFunction,PyProtectedMember,Mypy
-@_to_namedtuple.register(SimpleNamespace)  # type: ignore[no-redef]
+@_expand.register(SimpleNamespace)  # type: ignore[no-redef]
 def _(
         obj: SimpleNamespace,
         _started: bool = False
-) -> NamedTuple:
-    return _to_namedtuple(obj.__dict__)
+) -> Union[_Node, Tuple[Any, ...]]:
+    return _expand(obj.__dict__, _started)
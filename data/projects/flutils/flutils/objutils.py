@@ -1,12 +1,16 @@
 from collections import (
     UserList,
+    UserString,
     deque,
 )
 from collections.abc import (
+    Iterable,
     Iterator,
     KeysView,
+    Mapping,
     ValuesView,
 )
+from itertools import repeat
 from typing import Any as _Any
 
 
@@ -32,6 +36,15 @@ _LIST_LIKE = (
     UserList
 )
 
+_NOT_LIST_LIKE = (
+    str,
+    bytes,
+    bytearray,
+    memoryview,
+    UserString,
+    Mapping,
+)
+
 
 def has_any_attrs(obj: _Any, *attrs: str) -> bool:
     """Check if the given ``obj`` has **ANY** of the given ``*attrs``.
@@ -52,10 +65,7 @@ def has_any_attrs(obj: _Any, *attrs: str) -> bool:
         >>> has_any_attrs(dict(),'get','keys','items','values','something')
         True
     """
-    for attr in attrs:
-        if hasattr(obj, attr) is True:
-            return True
-    return False
+    return any(map(hasattr, repeat(obj), attrs))
 
 
 def has_any_callables(obj: _Any, *attrs: str) -> bool:
@@ -78,11 +88,7 @@ def has_any_callables(obj: _Any, *attrs: str) -> bool:
         >>> has_any_callables(dict(),'get','keys','items','values','foo')
         True
     """
-    if has_any_attrs(obj, *attrs) is True:
-        for attr in attrs:
-            if callable(getattr(obj, attr)) is True:
-                return True
-    return False
+    return any(map(callable, map(getattr, repeat(obj), attrs, repeat(None))))
 
 
 def has_attrs(
@@ -106,10 +112,7 @@ def has_attrs(
         >>> has_attrs(dict(),'get','keys','items','values')
         True
     """
-    for attr in attrs:
-        if hasattr(obj, attr) is False:
-            return False
-    return True
+    return all(map(hasattr, repeat(obj), attrs))
 
 
 # noinspection PyUnresolvedReferences
@@ -135,11 +138,8 @@ def has_callables(
         >>> has_callables(dict(),'get','keys','items','values')
         True
     """
-    if has_attrs(obj, *attrs) is True:
-        for attr in attrs:
-            if callable(getattr(obj, attr)) is False:
-                return False
-        return True
+    if has_attrs(obj, *attrs):
+        return all(map(callable, map(getattr, repeat(obj), attrs)))
     return False
 
 
@@ -148,7 +148,9 @@ def is_list_like(
 ) -> bool:
     """Check that given ``obj`` acts like a list and is iterable.
 
-    List-like objects are instances of:
+    List-like objects are instances of
+    :obj:`Iterable <collections.abc.Iterable>` that are not strings,
+    bytes or mappings.  For example:
 
     - :obj:`UserList <collections.UserList>`
     - :obj:`Iterator <collections.abc.Iterator>`
@@ -157,6 +159,7 @@ def is_list_like(
     - :obj:`deque <collections.deque>`
     - :obj:`frozenset`
     - :obj:`list`
+    - :obj:`range`
     - :obj:`set`
     - :obj:`tuple`
 
@@ -164,6 +167,7 @@ def is_list_like(
 
     - :obj:`None`
     - :obj:`bool`
+    - :obj:`bytearray`
     - :obj:`bytes`
     - :obj:`ChainMap <collections.ChainMap>`
     - :obj:`Counter <collections.Counter>`
@@ -175,6 +179,7 @@ def is_list_like(
     - :obj:`dict`
     - :obj:`float`
     - :obj:`int`
+    - :obj:`memoryview`
     - :obj:`str`
     - etc...
 
@@ -198,9 +203,7 @@ def is_list_like(
         >>> is_list_like(sorted('hello'))
         True
     """
-    if is_subclass_of_any(obj, *_LIST_LIKE):
-        return True
-    return False
+    return isinstance(obj, Iterable) and not isinstance(obj, _NOT_LIST_LIKE)
 
 
 def is_subclass_of_any(obj: _Any, *classes: _Any) -> bool:
@@ -225,7 +228,4 @@ def is_subclass_of_any(obj: _Any, *classes: _Any) -> bool:
         >>> is_subclass_of_any(obj.keys(),ValuesView,KeysView,UserList)
         True
     """
-    for cls in classes:
-        if issubclass(obj.__class__, cls):
-            return True
-    return False
+    return issubclass(obj.__class__, classes)
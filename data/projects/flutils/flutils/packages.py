@@ -1,6 +1,8 @@
 # pylint: disable=E0611,E0401
+from functools import lru_cache
 from typing import (
     Any,
+    Callable,
     Dict,
     Generator,
     List,
@@ -17,27 +19,19 @@ from distutils.version import StrictVersion
 __all__ = ['bump_version']
 
 
-_BUMP_VERSION_MAJOR: int = 0
-_BUMP_VERSION_MINOR: int = 1
-_BUMP_VERSION_PATCH: int = 2
-_BUMP_VERSION_MINOR_ALPHA: int = 3
-_BUMP_VERSION_MINOR_BETA: int = 4
-_BUMP_VERSION_MINORS: Tuple[int, ...] = (
-    _BUMP_VERSION_MINOR,
-    _BUMP_VERSION_MINOR_ALPHA,
-    _BUMP_VERSION_MINOR_BETA,
-)
-_BUMP_VERSION_PATCH_ALPHA: int = 5
-_BUMP_VERSION_PATCH_BETA: int = 6
-_BUMP_VERSION_PATCHES: Tuple[int, ...] = (
-    _BUMP_VERSION_PATCH,
-    _BUMP_VERSION_PATCH_ALPHA,
-    _BUMP_VERSION_PATCH_BETA,
-)
 _BUMP_VERSION_POSITION_NAMES: Dict[int, str] = {
-    _BUMP_VERSION_MAJOR: 'major',
-    _BUMP_VERSION_MINOR: 'minor',
-    _BUMP_VERSION_PATCH: 'patch',
+    0: 'major',
+    1: 'minor',
+    2: 'patch',
+}
+
+# Maps the accepted pre_release values to their short form.
+_BUMP_VERSION_PRE_RELEASES: Dict[str, str] = {
+    '': '',
+    'a': 'a',
+    'alpha': 'a',
+    'b': 'b',
+    'beta': 'b',
 }
 
 
@@ -68,14 +62,14 @@ def _each_version_part(
             'pre_num': -1,
             'name': _BUMP_VERSION_POSITION_NAMES[pos]
         }
-        if (prerelease_built is False and
+        if (not prerelease_built and
                 pos > 0 and
                 prerelease is not None):
             prerelease = cast(Tuple[str, int], prerelease)
             should_add = True
             if pos == 1 and version[2] != 0:
                 should_add = False
-            if should_add is True:
+            if should_add:
                 kwargs['txt'] = '%s%s%s' % (
                     kwargs['txt'],
                     prerelease[0],
@@ -95,6 +89,9 @@ class _VersionInfo(NamedTuple):
     pre_pos: int  # The pre-release position. -1 means no pre-release
 
 
+# The parsed version information is immutable; so, it's cached for when
+# the same version is bumped more than once.
+@lru_cache(maxsize=128)
 def _build_version_info(
         version: str
 ) -> _VersionInfo:
@@ -115,7 +112,7 @@ def _build_version_bump_position(
     pos_min = -3
     pos_max = 2
 
-    if (pos_min <= position <= pos_max) is False:
+    if not (pos_min <= position <= pos_max):
         raise ValueError(
             "The given value for 'position', %r, must be an 'int' "
             "between (%r) and (%r)." % (position, pos_min, pos_max)
@@ -127,43 +124,99 @@ def _build_version_bump_position(
     return position
 
 
+def _bump_major(ver_info: _VersionInfo) -> str:
+    return '%s.0' % (ver_info.major.num + 1)
+
+
+def _bump_minor(ver_info: _VersionInfo) -> str:
+    if ver_info.minor.pre_txt:
+        return '%s.%s' % (ver_info.major.num, ver_info.minor.num)
+    return '%s.%s' % (ver_info.major.num, ver_info.minor.num + 1)
+
+
+def _bump_minor_alpha(ver_info: _VersionInfo) -> str:
+    if ver_info.minor.pre_txt == 'a':
+        part = '%sa%s' % (ver_info.minor.num, ver_info.minor.pre_num + 1)
+    else:
+        part = '{}a0'.format(ver_info.minor.num + 1)
+    return '%s.%s' % (ver_info.major.num, part)
+
+
+def _bump_minor_beta(ver_info: _VersionInfo) -> str:
+    if ver_info.minor.pre_txt == 'a':
+        part = '{}b0'.format(ver_info.minor.num)
+    elif ver_info.minor.pre_txt == 'b':
+        part = '%sb%s' % (ver_info.minor.num, ver_info.minor.pre_num + 1)
+    else:
+        part = '{}b0'.format(ver_info.minor.num + 1)
+    return '%s.%s' % (ver_info.major.num, part)
+
+
+def _bump_patch(ver_info: _VersionInfo) -> str:
+    if ver_info.patch.pre_txt:
+        num = ver_info.patch.num
+    else:
+        num = ver_info.patch.num + 1
+    return '%s.%s.%s' % (ver_info.major.num, ver_info.minor.num, num)
+
+
+def _bump_patch_alpha(ver_info: _VersionInfo) -> str:
+    if ver_info.patch.pre_txt == 'a':
+        part = '%sa%s' % (ver_info.patch.num, ver_info.patch.pre_num + 1)
+    else:
+        part = '{}a0'.format(ver_info.patch.num + 1)
+    return '%s.%s.%s' % (ver_info.major.num, ver_info.minor.num, part)
+
+
+def _bump_patch_beta(ver_info: _VersionInfo) -> str:
+    if ver_info.patch.pre_txt == 'a':
+        part = '{}b0'.format(ver_info.patch.num)
+    elif ver_info.patch.pre_txt == 'b':
+        part = '%sb%s' % (ver_info.patch.num, ver_info.patch.pre_num + 1)
+    else:
+        part = '{}b0'.format(ver_info.patch.num + 1)
+    return '%s.%s.%s' % (ver_info.major.num, ver_info.minor.num, part)
+
+
+_BumpHandler = Callable[[_VersionInfo], str]
+
+# Maps the (positive) bump position and the short form of the
+# pre-release to the function that bumps the version.
+_BUMP_HANDLERS: Dict[Tuple[int, str], _BumpHandler] = {
+    (0, ''): _bump_major,
+    (1, ''): _bump_minor,
+    (1, 'a'): _bump_minor_alpha,
+    (1, 'b'): _bump_minor_beta,
+    (2, ''): _bump_patch,
+    (2, 'a'): _bump_patch_alpha,
+    (2, 'b'): _bump_patch_beta,
+}
+
+
 def _build_version_bump_type(
         position_positive: int,
         pre_release: Union[str, None]
-) -> int:
+) -> _BumpHandler:
     if pre_release is None:
         prerelease = ''
     else:
         pre_release = cast(str, pre_release)
         prerelease = pre_release.strip().lower()
 
-    if prerelease == '':
-        if position_positive == 0:
-            return _BUMP_VERSION_MAJOR
-        if position_positive == 1:
-            return _BUMP_VERSION_MINOR
-        return _BUMP_VERSION_PATCH
-    if prerelease in ('a', 'alpha', 'b', 'beta'):
-        is_alpha = False
-        if prerelease in ('a', 'alpha'):
-            is_alpha = True
-
-        if position_positive == 0:
-            raise ValueError(
-                "Only the 'minor' or 'patch' parts of the version number "
-                "can get a prerelease bump."
-            )
-        if position_positive == 1:
-            if is_alpha is True:
-                return _BUMP_VERSION_MINOR_ALPHA
-            return _BUMP_VERSION_MINOR_BETA
-        if is_alpha is True:
-            return _BUMP_VERSION_PATCH_ALPHA
-        return _BUMP_VERSION_PATCH_BETA
-    raise ValueError(
-        "The given value for 'pre_release', %r, can only be one of: "
-        "'a', 'alpha', 'b', 'beta', None."
-    )
+    try:
+        prerelease = _BUMP_VERSION_PRE_RELEASES[prerelease]
+    except KeyError:
+        raise ValueError(
+            "The given value for 'pre_release', %r, can only be one of: "
+            "'a', 'alpha', 'b', 'beta', None." % pre_release
+        )
+    try:
+        return _BUMP_HANDLERS[(position_positive, prerelease)]
+    except KeyError:
+        raise ValueError(
+            "Only the 'minor' or 'patch' parts of the version number "
+            "can get a prerelease bump."
+        )
 
 
 def bump_version(
@@ -222,71 +275,5 @@ def bump_version(
     """
     ver_info = _build_version_info(version)
     position = _build_version_bump_position(position)
-    bump_type = _build_version_bump_type(position, pre_release)
-    # noinspection PyUnusedLocal
-    hold: List[Union[int, str]] = []
-    if bump_type == _BUMP_VERSION_MAJOR:
-        hold = [ver_info.major.num + 1, 0]
-    elif bump_type in _BUMP_VERSION_MINORS:
-        if bump_type == _BUMP_VERSION_MINOR:
-            if ver_info.minor.pre_txt:
-                hold = [ver_info.major.num, ver_info.minor.num]
-            else:
-                hold = [ver_info.major.num, ver_info.minor.num + 1]
-        else:
-            if bump_type == _BUMP_VERSION_MINOR_ALPHA:
-                if ver_info.minor.pre_txt == 'a':
-                    part = '%sa%s' % (
-                        ver_info.minor.num,
-                        ver_info.minor.pre_num + 1
-                    )
-                else:
-                    part = '{}a0'.format(ver_info.minor.num + 1)
-            else:
-                if ver_info.minor.pre_txt == 'a':
-                    part = '{}b0'.format(ver_info.minor.num)
-                elif ver_info.minor.pre_txt == 'b':
-                    part = '%sb%s' % (
-                        ver_info.minor.num,
-                        ver_info.minor.pre_num + 1
-                    )
-                else:
-                    part = '{}b0'.format(ver_info.minor.num + 1)
-            hold = [ver_info.major.num, part]
-    else:
-        if bump_type == _BUMP_VERSION_PATCH:
-            if ver_info.patch.pre_txt:
-                hold = [
-                    ver_info.major.num,
-                    ver_info.minor.num,
-                    ver_info.patch.num
-                ]
-            else:
-                hold = [
-                    ver_info.major.num,
-                    ver_info.minor.num,
-                    ver_info.patch.num + 1
-                ]
-        else:
-            if bump_type == _BUMP_VERSION_PATCH_ALPHA:
-                if ver_info.patch.pre_txt == 'a':
-                    part = '%sa%s' % (
-                        ver_info.patch.num,
-                        ver_info.patch.pre_num + 1
-                    )
-                else:
-                    part = '{}a0'.format(ver_info.patch.num + 1)
-            else:
-                if ver_info.patch.pre_txt == 'a':
-                    part = '{}b0'.format(ver_info.patch.num)
-
-                elif ver_info.patch.pre_txt == 'b':
-                    part = '%sb%s' % (
-                        ver_info.patch.num,
-                        ver_info.patch.pre_num + 1
-                    )
-                else:
-                    part = '{}b0'.format(ver_info.patch.num + 1)
-            hold = [ver_info.major.num, ver_info.minor.num, part]
-    out = '.'.join(map(str, hold))
-    return out
+    bump = _build_version_bump_type(position, pre_release)
+    return bump(ver_info)
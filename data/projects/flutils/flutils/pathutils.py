@@ -1,20 +1,29 @@
+import errno
+import fnmatch
 import functools
 import getpass
 import grp
 import os
 import pwd
+import re
+import stat
 import sys
 from collections import deque
 from os import PathLike
 from pathlib import (
     Path,
     PosixPath,
+    PurePath,
     WindowsPath,
 )
 from typing import (
+    Callable,
     Deque,
+    Dict,
     Generator,
+    List,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -47,6 +56,144 @@ _STR_OR_INT_OR_NONE = Union[
     None
 ]
 
+# The errno values that mean a path does not exist (the same ones
+# ignored by the pathlib.Path.is_*() methods).
+_IGNORED_ERRNOS = (
+    errno.ENOENT,
+    errno.ENOTDIR,
+    errno.EBADF,
+    errno.ELOOP,
+)
+
+_FILE_TYPE_NAMES: Dict[int, str] = {
+    stat.S_IFDIR: 'directory',
+    stat.S_IFREG: 'file',
+    stat.S_IFBLK: 'block device',
+    stat.S_IFCHR: 'char device',
+    stat.S_IFIFO: 'FIFO',
+    stat.S_IFSOCK: 'socket',
+}
+
+
+_GlobMatch = Tuple[str, bool, bool]
+
+_has_glob_magic = re.compile('[*?[]').search
+
+# The file system encoding can not change once Python has started.
+_FS_ENCODING = sys.getfilesystemencoding()
+
+
+def _stat_match(path: str) -> Optional[_GlobMatch]:
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return None
+    return path, stat.S_ISDIR(mode), stat.S_ISREG(mode)
+
+
+def _iter_glob(pattern: str) -> Generator[_GlobMatch, None, None]:
+    """Yield each path matching the given absolute :term:`glob pattern`.
+
+    Each yielded item is a tuple of the matching path (as a :obj:`str`),
+    whether the path is a directory and whether the path is a regular
+    file (symlinks are followed for both).  The directory contents are read
+    with :obj:`os.scandir`, so no extra ``stat`` call is needed per entry.
+
+    A ``**`` component matches zero or more directories (symlinks to
+    directories are not followed).  A trailing ``**`` matches the directory
+    itself and everything beneath it.
+    """
+    parts = pattern.split('/')
+
+    # Start the walk at the longest leading path without a pattern.
+    pos = 0
+    while pos < len(parts) and not _has_glob_magic(parts[pos]):
+        pos += 1
+    root = '/'.join(parts[:pos]) or '/'
+    parts = parts[pos:]
+    if not parts:
+        match = _stat_match(root)
+        if match is not None:
+            yield match
+        return
+
+    last = len(parts) - 1
+    matchers: List[Optional[Callable[[str], object]]] = [
+        re.compile(fnmatch.translate(part)).match
+        if part != '**' and _has_glob_magic(part) else None
+        for part in parts
+    ]
+    # A path can only be matched more than once with multiple '**'.
+    seen: Optional[set] = None
+    if parts.count('**') > 1:
+        seen = set()
+
+    stack: List[Tuple[str, int]] = [(root, 0)]
+    while stack:
+        dir_path, idx = stack.pop()
+        part = parts[idx]
+        matcher = matchers[idx]
+        found: List[_GlobMatch] = []
+
+        if part == '**' and idx == last:
+            # Only an existing directory matches a trailing '**'.
+            match = _stat_match(dir_path)
+            if match is None or match[1] is False:
+                continue
+            found.append(match)
+            dirs = [dir_path]
+            while dirs:
+                try:
+                    with os.scandir(dirs.pop()) as entries:
+                        for entry in entries:
+                            found.append(
+                                (entry.path, entry.is_dir(), entry.is_file())
+                            )
+                            if entry.is_dir(follow_symlinks=False):
+                                dirs.append(entry.path)
+                except OSError:
+                    pass
+        elif part == '**':
+            # Match zero directories, then one more directory deep.
+            stack.append((dir_path, idx + 1))
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, idx))
+            except OSError:
+                pass
+        elif matcher is None:
+            # A literal part, so there is no need to read the directory.
+            path = os.path.join(dir_path, part)
+            if idx == last:
+                match = _stat_match(path)
+                if match is not None:
+                    found.append(match)
+            elif os.path.isdir(path):
+                stack.append((path, idx + 1))
+        else:
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if not matcher(entry.name):
+                            continue
+                        if idx == last:
+                            found.append(
+                                (entry.path, entry.is_dir(), entry.is_file())
+                            )
+                        elif entry.is_dir():
+                            stack.append((entry.path, idx + 1))
+            except OSError:
+                pass
+
+        for match in found:
+            if seen is not None:
+                if match[0] in seen:
+                    continue
+                seen.add(match[0])
+            yield match
+
 
 def chmod(
         path: _PATH,
@@ -72,7 +219,9 @@ def chmod(
     Args:
         path (:obj:`str`, :obj:`bytes` or :obj:`Path <pathlib.Path>`):
             The path of the file or directory to have it's mode changed.  This
-            value can be a :term:`glob pattern`.
+            value can be a :term:`glob pattern`.  Any ``*``, ``?`` or ``[``
+            makes the whole value a :term:`glob pattern`; escape a literal
+            ``[``, ``*`` or ``?`` in a name as ``[[]``, ``[*]`` or ``[?]``.
         mode_file (:obj:`int`, optional): The mode applied to the given
             ``path`` that is a file or a symlink target that is a file.
             Defaults to ``0o600``.
@@ -108,31 +257,45 @@ def chmod(
     if mode_dir is None:
         mode_dir = 0o700
 
-    if '*' in path.as_posix():
-        try:
-            for sub_path in Path().glob(path.as_posix()):
-                if sub_path.is_dir() is True:
-                    sub_path.chmod(mode_dir)
-                elif sub_path.is_file():
-                    sub_path.chmod(mode_file)
-
-        # Path().glob() returns an iterator that will
-        # raise NotImplementedError if there
-        # are no results from the glob pattern.
-        except NotImplementedError:
-            pass
+    posix = path.as_posix()
+    if _has_glob_magic(posix):
+        found = False
+        for sub_path, is_dir, is_file in _iter_glob(posix):
+            found = True
+            if is_dir is True:
+                os.chmod(sub_path, mode_dir)
+            elif is_file:
+                os.chmod(sub_path, mode_file)
+
+        if found is True and include_parent is True:
+            match = _stat_match(path.parent.as_posix())
+            if match is not None and match[1] is True:
+                os.chmod(match[0], mode_dir)
+    else:
+        # A single stat() gives both the existence and the type.
+        match = _stat_match(posix)
+        if match is not None:
+            if match[1] is True:
+                os.chmod(posix, mode_dir)
+            elif match[2] is True:
+                os.chmod(posix, mode_file)
 
-        else:
-            if include_parent is True:
-                parent = path.parent
-                if parent.is_dir():
-                    parent.chmod(mode_dir)
+
+def _get_uid_gid(
+        user: Optional[str] = None,
+        group: Optional[str] = None
+) -> Tuple[int, int]:
+    """Return the uid and gid used by :obj:`~flutils.pathutils.chown`."""
+    if isinstance(user, str) and user == '-1':
+        uid = -1
     else:
-        if path.exists() is True:
-            if path.is_dir():
-                path.chmod(mode_dir)
-            elif path.is_file():
-                path.chmod(mode_file)
+        uid = get_os_user(user).pw_uid
+
+    if isinstance(group, str) and group == '-1':
+        gid = -1
+    else:
+        gid = get_os_group(group).gr_gid
+    return uid, gid
 
 
 def chown(
@@ -151,7 +314,10 @@ def chown(
     Args:
         path (:obj:`str`, :obj:`bytes` or :obj:`Path <pathlib.Path>`):
             The path of the file or directory that will have it's ownership
-            changed.  This value can be a :term:`glob pattern`.
+            changed.  This value can be a :term:`glob pattern`.  Any ``*``,
+            ``?`` or ``[`` makes the whole value a :term:`glob pattern`;
+            escape a literal ``[``, ``*`` or ``?`` in a name as ``[[]``,
+            ``[*]`` or ``[?]``.
         user (:obj:`str` or :obj:`int`, optional): The "login name" used to set
             the owner of ``path``.  A value of ``'-1'`` will leave the
             owner unchanged.  Defaults to the "login name" of the current user.
@@ -186,34 +352,23 @@ def chown(
 
     """
     path = normalize_path(path)
-    if isinstance(user, str) and user == '-1':
-        uid = -1
-    else:
-        uid = get_os_user(user).pw_uid
-
-    if isinstance(user, str) and group == '-1':
-        gid = -1
-    else:
-        gid = get_os_group(group).gr_gid
-
-    if '*' in path.as_posix():
-        try:
-            for sub_path in Path().glob(path.as_posix()):
-                if sub_path.is_dir() or sub_path.is_file():
-                    os.chown(sub_path.as_posix(), uid, gid)
-        except NotImplementedError:
-            # Path().glob() returns an iterator that will
-            # raise NotImplementedError if there
-            # are no results from the glob pattern.
-            pass
-        else:
-            if include_parent is True:
-                path = path.parent
-                if path.is_dir() is True:
-                    os.chown(path.as_posix(), uid, gid)
+    uid, gid = _get_uid_gid(user, group)
+
+    posix = path.as_posix()
+    if _has_glob_magic(posix):
+        found = False
+        for sub_path, is_dir, is_file in _iter_glob(posix):
+            found = True
+            if is_dir or is_file:
+                os.chown(sub_path, uid, gid)
+
+        if found is True and include_parent is True:
+            path = path.parent
+            if path.is_dir() is True:
+                os.chown(path.as_posix(), uid, gid)
     else:
         if path.exists() is True:
-            os.chown(path.as_posix(), uid, gid)
+            os.chown(posix, uid, gid)
 
 
 def directory_present(
@@ -250,7 +405,9 @@ def directory_present(
             the group unchanged.  Defaults to the current user's group.
 
     Raises:
-        ValueError: if the given ``path`` contains a glob pattern.
+        ValueError: if the given ``path`` contains a glob pattern.  Any
+            ``*``, ``?`` or ``[`` counts, so a directory name containing
+            one of these characters cannot be used.
         ValueError: if the given ``path`` is not an absolute path.
         FileExistsError: if the given ``path`` exists and is not a directory.
         FileExistsError: if a parent of the given ``path`` exists and is
@@ -272,63 +429,67 @@ def directory_present(
 
     """
     path = normalize_path(path)
+    posix = path.as_posix()
 
-    if '*' in path.as_posix():
+    if _has_glob_magic(posix):
         raise ValueError(
             'The path: %r must NOT contain any glob patterns.'
-            % path.as_posix()
+            % posix
         )
     if path.is_absolute() is False:
         raise ValueError(
             'The path: %r must be an absolute path.  A path is considered '
             'absolute if it has both a root and (if the flavour allows) a '
             'drive.'
-            % path.as_posix()
+            % posix
         )
 
-    # Create a queue of paths to be created as directories.
-    paths: Deque = deque()
+    if mode is None:
+        mode = 0o700
 
-    path_exists_as = exists_as(path)
-    if path_exists_as == '':
-        paths.append(path)
-    elif path_exists_as != 'directory':
+    path_exists_as = _exists_as(posix)
+    if path_exists_as == 'directory':
+        # The given path already exists; only the mode and the
+        # ownership need to be set.
+        chmod(path, mode_dir=mode)
+        chown(path, user=user, group=group)
+        return path
+    if path_exists_as != '':
         raise FileExistsError(
             'The path: %r can NOT be created as a directory because it '
-            'already exists as a %s.' % (path.as_posix(), path_exists_as)
+            'already exists as a %s.' % (posix, path_exists_as)
         )
 
-    parent = path.parent
-    child = path
+    # Create a queue of paths to be created as directories.
+    paths: Deque[str] = deque([posix])
+    parent = os.path.dirname(posix)
+    child = posix
 
     # Traverse the path backwards and add any directories that
-    # do no exist to the path queue.
-    while child.as_posix() != parent.as_posix():
-        parent_exists_as = exists_as(parent)
+    # do no exist to the path queue.  The path is already normalized;
+    # so, plain string operations are used for each parent.
+    while child != parent:
+        parent_exists_as = _exists_as(parent)
         if parent_exists_as == '':
             paths.appendleft(parent)
             child = parent
-            parent = parent.parent
+            parent = os.path.dirname(parent)
         elif parent_exists_as == 'directory':
             break
         else:
             raise FileExistsError(
-                'Unable to create the directory: %r because the'
+                'Unable to create the directory: %r because the '
                 'parent path: %r exists as a %s.'
-                % (path.as_posix, parent.as_posix(), parent_exists_as)
+                % (posix, parent, parent_exists_as)
             )
 
-    if mode is None:
-        mode = 0o700
-
-    if paths:
-        for build_path in paths:
-            build_path.mkdir(mode=mode)
-            chown(build_path, user=user, group=group)
-    else:
-        # The given path already existed only need to do a chown.
-        chmod(path, mode_dir=mode)
-        chown(path, user=user, group=group)
+    # Each directory is created with the given mode (os.makedirs() does
+    # not apply the mode to the parent directories); and, the owner is
+    # looked up once for all of the directories.
+    uid, gid = _get_uid_gid(user, group)
+    for build_path in paths:
+        os.mkdir(build_path, mode)
+        os.chown(build_path, uid, gid)
 
     return path
 
@@ -368,20 +529,22 @@ def exists_as(path: _PATH) -> str:
         'directory'
     """
     path = normalize_path(path)
+    return _exists_as(path.as_posix())
+
 
-    if path.is_dir():
-        return 'directory'
-    if path.is_file():
-        return 'file'
-    if path.is_block_device():
-        return 'block device'
-    if path.is_char_device():
-        return 'char device'
-    if path.is_fifo():
-        return 'FIFO'
-    if path.is_socket():
-        return 'socket'
-    return ''
+def _exists_as(path: str) -> str:
+    # A single stat call is used, instead of one for each of the
+    # Path.is_*() methods.
+    try:
+        mode = os.stat(path).st_mode
+    except OSError as e:
+        if e.errno in _IGNORED_ERRNOS:
+            return ''
+        raise
+    except ValueError:
+        # The path contains characters that can't be used in a path.
+        return ''
+    return _FILE_TYPE_NAMES.get(stat.S_IFMT(mode), '')
 
 
 def find_paths(
@@ -414,6 +577,29 @@ def find_paths(
     yield from Path(pattern.anchor).glob(search)
 
 
+# The user and group database lookups can be slow (e.g. when going
+# through LDAP); so, the results are cached.  Failed lookups raise
+# KeyError and are not cached.
+@functools.lru_cache(maxsize=128)
+def _getgrgid(gid: int) -> grp.struct_group:
+    return grp.getgrgid(gid)
+
+
+@functools.lru_cache(maxsize=128)
+def _getgrnam(name: str) -> grp.struct_group:
+    return grp.getgrnam(name)
+
+
+@functools.lru_cache(maxsize=128)
+def _getpwuid(uid: int) -> pwd.struct_passwd:
+    return pwd.getpwuid(uid)
+
+
+@functools.lru_cache(maxsize=128)
+def _getpwnam(name: str) -> pwd.struct_passwd:
+    return pwd.getpwnam(name)
+
+
 def get_os_group(name: _STR_OR_INT_OR_NONE = None) -> grp.struct_group:
     """Get an operating system group object.
 
@@ -443,14 +629,14 @@ def get_os_group(name: _STR_OR_INT_OR_NONE = None) -> grp.struct_group:
         name = cast(int, name)
     if isinstance(name, int):
         try:
-            return grp.getgrgid(name)
+            return _getgrgid(name)
         except KeyError:
             raise OSError(
                 'The given gid: %r, is not a valid gid for this operating '
                 'system.' % name
             )
     try:
-        return grp.getgrnam(name)
+        return _getgrnam(name)
     except KeyError:
         raise OSError(
             'The given name: %r, is not a valid "group name" '
@@ -484,7 +670,7 @@ def get_os_user(name: _STR_OR_INT_OR_NONE = None) -> pwd.struct_passwd:
     """
     if isinstance(name, int):
         try:
-            return pwd.getpwuid(name)
+            return _getpwuid(name)
         except KeyError:
             raise OSError(
                 'The given uid: %r, is not a valid uid for this operating '
@@ -493,7 +679,7 @@ def get_os_user(name: _STR_OR_INT_OR_NONE = None) -> pwd.struct_passwd:
     if name is None:
         name = getpass.getuser()
     try:
-        return pwd.getpwnam(name)
+        return _getpwnam(name)
     except KeyError:
         raise OSError(
             'The given name: %r, is not a valid "login name" '
@@ -501,7 +687,6 @@ def get_os_user(name: _STR_OR_INT_OR_NONE = None) -> pwd.struct_passwd:
         )
 
 
-@functools.singledispatch
 def normalize_path(path: _PATH) -> Path:
     """Normalize a given path.
 
@@ -545,32 +730,28 @@ def normalize_path(path: _PATH) -> Path:
         PosixPath('/home/test_user/tmp/bar')
 
     """
-    path = cast(PathLike, path)
+    # Plain isinstance() checks are cheaper than a singledispatch
+    # lookup for these few types.
+    if isinstance(path, bytes):
+        path = path.decode(_FS_ENCODING)
+    elif isinstance(path, PurePath):
+        path = path.as_posix()
     path = os.path.expanduser(path)
-    path = cast(PathLike, path)
     path = os.path.expandvars(path)
-    path = cast(PathLike, path)
     if os.path.isabs(path) is False:
         path = os.path.join(os.getcwd(), path)
-    path = cast(PathLike, path)
+    return _normalize_absolute_path(path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_absolute_path(path: str) -> Path:
+    # The result only depends on the given (absolute) path; so, it is
+    # safe to cache.  Path objects are immutable and can be shared.
     path = os.path.normpath(path)
-    path = cast(PathLike, path)
     path = os.path.normcase(path)
-    path = cast(PathLike, path)
     return Path(path)
 
 
-@normalize_path.register(bytes)
-def _normalize_path_bytes(path: bytes) -> Path:
-    out: str = path.decode(sys.getfilesystemencoding())
-    return normalize_path(out)
-
-
-@normalize_path.register(Path)
-def _normalize_path_pathlib(path: Path) -> Path:
-    return normalize_path(path.as_posix())
-
-
 def path_absent(
         path: _PATH,
 ) -> None:
@@ -604,18 +785,21 @@ def path_absent(
         if os.path.islink(path):
             os.unlink(path)
         elif os.path.isdir(path):
-            for root, dirs, files in os.walk(path, topdown=False):
+            # Remove everything relative to the file descriptor of each
+            # directory; so, the kernel does not have to resolve the full
+            # path for each removal.
+            for _, dirs, files, root_fd in os.fwalk(path, topdown=False):
                 for name in files:
-                    p = os.path.join(root, name)
-                    if os.path.isfile(p) or os.path.islink(p):
-                        os.unlink(p)
+                    os.unlink(name, dir_fd=root_fd)
                 for name in dirs:
-                    p = os.path.join(root, name)
-                    if os.path.islink(p):
-                        os.unlink(p)
-                    else:
-                        os.rmdir(p)
-            if os.path.isdir(path):
+                    try:
+                        os.rmdir(name, dir_fd=root_fd)
+                    except NotADirectoryError:
+                        # A symlink to a directory.
+                        os.unlink(name, dir_fd=root_fd)
+            try:
                 os.rmdir(path)
+            except FileNotFoundError:
+                pass
         else:
             os.unlink(path)
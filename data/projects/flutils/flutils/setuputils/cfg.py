@@ -1,13 +1,12 @@
 import os
+import stat
 from configparser import (
     ConfigParser,
     NoOptionError,
     NoSectionError,
 )
-from traceback import (
-    FrameSummary,
-    extract_stack,
-)
+from sys import _getframe
+from types import FrameType
 from typing import (
     Dict,
     Generator,
@@ -27,6 +26,13 @@ class SetupCfgCommandConfig(NamedTuple):
     camel: str
     description: str
     commands: Tuple[str, ...]
+    parallel: bool = False
+
+
+_COMMAND_OPTIONS = ('command', 'commands')
+
+_COMMAND_SECTION_PREFIX = 'setup.command.'
+_COMMAND_SECTION_PREFIX_LEN = len(_COMMAND_SECTION_PREFIX)
 
 
 def _each_setup_cfg_command_section(
@@ -34,37 +40,46 @@ def _each_setup_cfg_command_section(
 ) -> Generator[Tuple[str, str], None, None]:
     for section in parser.sections():
         section = cast(str, section)
-        section = section.strip()
-        if section.startswith('setup.command.'):
-            command_name = '.'.join(section.split('.')[2:])
+        if section.startswith(_COMMAND_SECTION_PREFIX):
+            command_name = section[_COMMAND_SECTION_PREFIX_LEN:]
             if command_name:
                 yield section, command_name
 
 
+def _get_parallel(section: str, options: Dict[str, str]) -> bool:
+    val = options.get('parallel', '').strip().lower()
+    if not val:
+        return False
+    if val not in ConfigParser.BOOLEAN_STATES:
+        raise ValueError(
+            "The 'parallel' option, in the %r section, must be a boolean "
+            "value.  Got: %r" % (section, options['parallel'])
+        )
+    return ConfigParser.BOOLEAN_STATES[val]
+
+
 def _each_setup_cfg_command(
         parser: ConfigParser,
         format_kwargs: Dict[str, str]
 ) -> Generator[SetupCfgCommandConfig, None, None]:
     for section, command_name in _each_setup_cfg_command_section(parser):
+        # Read all of the section's (raw) options in one go, instead of
+        # looking up (and interpolating) each option separately.
+        options: Dict[str, str] = dict(parser.items(section, raw=True))
         commands: List[str] = []
-        options: List[str] = parser.options(section)
-        for option in ('command', 'commands'):
+        for option in _COMMAND_OPTIONS:
             if option in options:
-                val: str = parser.get(section, option)
+                val: str = options[option]
                 val = val.format(**format_kwargs)
-                commands += list(
-                    filter(len, map(lambda x: x.strip(), val.splitlines()))
+                commands.extend(
+                    line for line in map(str.strip, val.splitlines())
+                    if line
                 )
         if commands:
-            cmd_name = ''
-            if 'name' in options:
-                cmd_name = parser.get(section, 'name')
-            cmd_name = cmd_name or command_name
+            cmd_name = options.get('name', '') or command_name
             cmd_name = cmd_name.format(name=format_kwargs['name'])
 
-            description = ''
-            if 'description' in options:
-                description = parser.get(section, 'description')
+            description = options.get('description', '')
             description = description.format(**format_kwargs)
 
             title = cmd_name.replace('.', '_')
@@ -75,7 +90,8 @@ def _each_setup_cfg_command(
                     cmd_name,
                     underscore_to_camel(title, lower_first=False),
                     description,
-                    tuple(commands)
+                    tuple(commands),
+                    _get_parallel(section, options)
                 )
 
 
@@ -107,28 +123,33 @@ def _get_name(
 
 def _validate_setup_dir(setup_dir: str) -> None:
     """Validates the given ``setup_dir``."""
-    if os.path.exists(setup_dir) is False:
+    try:
+        st_mode = os.stat(setup_dir).st_mode
+    except (OSError, ValueError):
         raise FileNotFoundError(
             "The given 'setup_dir' of %r does NOT exist."
             % setup_dir
         )
-    if os.path.isdir(setup_dir) is False:
+    if stat.S_ISDIR(st_mode) is False:
         raise NotADirectoryError(
             "The given 'setup_dir' of %r is NOT a directory."
             % setup_dir
         )
-    path = os.path.join(setup_dir, 'setup.py')
-    if os.path.isfile(path) is False:
-        raise FileNotFoundError(
-            "The given 'setup_dir' of %r does NOT contain a setup.py "
-            "file." % setup_dir
-        )
-    path = os.path.join(setup_dir, 'setup.cfg')
-    if os.path.isfile(path) is False:
-        raise FileNotFoundError(
-            "The given 'setup_dir' of %r does NOT contain a setup.cfg "
-            "file." % setup_dir
-        )
+    # A single directory scan gives the type of both files; on most
+    # systems DirEntry.is_file() does not need another stat() call.
+    try:
+        with os.scandir(setup_dir) as it:
+            entries: Dict[str, os.DirEntry] = {
+                entry.name: entry for entry in it
+            }
+    except OSError:
+        entries = {}
+    for name in ('setup.py', 'setup.cfg'):
+        if name not in entries or entries[name].is_file() is False:
+            raise FileNotFoundError(
+                "The given 'setup_dir' of %r does NOT contain a %s "
+                "file." % (setup_dir, name)
+            )
 
 
 def _prep_setup_dir(
@@ -142,13 +163,19 @@ def _prep_setup_dir(
         _validate_setup_dir(setup_dir)
         return os.path.realpath(setup_dir)
 
-    for fs in extract_stack():
-        fs = cast(FrameSummary, fs)
-        basename = os.path.basename(fs.filename)
-        if basename == 'setup.py':
-            setup_dir = str(os.path.dirname(fs.filename))
-            _validate_setup_dir(setup_dir)
-            return os.path.realpath(setup_dir)
+    # Walk the frames of the call stack, only looking at each frame's
+    # filename.  The outermost 'setup.py' frame is used.
+    filename = ''
+    # noinspection PyProtectedMember
+    frame: Optional[FrameType] = _getframe(1)
+    while frame is not None:
+        if os.path.basename(frame.f_code.co_filename) == 'setup.py':
+            filename = frame.f_code.co_filename
+        frame = frame.f_back
+    if filename:
+        setup_dir = str(os.path.dirname(filename))
+        _validate_setup_dir(setup_dir)
+        return os.path.realpath(setup_dir)
     raise FileNotFoundError(
         "Unable to find the directory that contains the 'setup.py' file."
     )
@@ -162,11 +189,11 @@ def each_sub_command_config(
         'home': os.path.expanduser('~')
     }
     setup_cfg_path = os.path.join(format_kwargs['setup_dir'], 'setup.cfg')
-    parser = ConfigParser()
+    parser = ConfigParser(interpolation=None)
     parser.read(setup_cfg_path)
     format_kwargs['name'] = _get_name(parser, setup_cfg_path)
     path = os.path.join(format_kwargs['setup_dir'], 'setup_commands.cfg')
     if os.path.isfile(path):
-        parser = ConfigParser()
+        parser = ConfigParser(interpolation=None)
         parser.read(path)
     yield from _each_setup_cfg_command(parser, format_kwargs)
@@ -2,6 +2,9 @@ import os
 import shlex
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
 from typing import (
     ClassVar,
     Generator,
@@ -17,6 +20,9 @@ from .cfg import SetupCfgCommandConfig
 from ..cmdutils import run
 
 
+# The same few executables are usually used by many commands; so, each
+# lookup (a PATH scan by shutil.which) is only done once.
+@lru_cache(maxsize=256)
 def _get_path(cmd: str) -> str:
     if cmd.startswith(os.path.sep):
         if os.path.isfile(cmd) is True:
@@ -83,14 +89,68 @@ def _finalize_options(self) -> None:
     pass
 
 
+def _run_captured(command: Tuple[str, ...]) -> Tuple[int, bytes]:
+    with BytesIO() as stream:
+        val = run(command, stdout=stream, stderr=stream)
+        return val, stream.getvalue()
+
+
+def _run_parallel(commands: List[Tuple[str, ...]]) -> None:
+    # Each command runs in its own process; so, a thread is all that is
+    # needed to wait on each one.  The output of each command is captured
+    # and shown, in order, once the command has finished.
+    max_workers = min(len(commands), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_run_captured, command) for command in commands
+        ]
+        failed: List[Tuple[Tuple[str, ...], int]] = []
+        encoding = getattr(sys.stdout, 'encoding', None) or 'utf-8'
+        for command, future in zip(commands, futures):
+            val, output = future.result()
+            _show_command(command)
+            sys.stdout.write(output.decode(encoding, 'replace'))
+            sys.stdout.flush()
+            if val != 0:
+                failed.append((command, val))
+    if failed:
+        # Exit with the code of the first failing command, in the
+        # configured order, not the first one to finish.
+        raise SystemExit(failed[0][1])
+
+
 def _run(self) -> None:
+    # Return normally on success so that setuptools can go on to run any
+    # other commands given on the same command line.  A failing command
+    # raises SystemExit with its own exit code; in parallel mode every
+    # command still runs and the code of the first failing command (in
+    # the configured order) is used.
+    if self.parallel is True:
+        commands = list(_each_command(self.commands))
+        if len(commands) > 1:
+            _run_parallel(commands)
+            return
     for command in _each_command(self.commands):
         _show_command(command)
         val = run(command)
         if val != 0:
-            sys.exit(val)
-            return
-    sys.exit(0)
+            raise SystemExit(val)
+
+
+class _SetupCfgCommand(Command):
+    """The base class of the commands built by
+    :func:`build_setup_cfg_command_class`.
+    """
+    name: ClassVar[str] = ''
+    root_path: ClassVar[str] = ''
+    description: ClassVar[str] = ''
+    user_options: ClassVar[List[str]] = []
+    commands: ClassVar[Tuple[str, ...]] = ()
+    parallel: ClassVar[bool] = False
+
+    initialize_options = _initialize_options
+    finalize_options = _finalize_options
+    run = _run
 
 
 _type = type  # Allows for easy mocking of type.
@@ -99,29 +159,18 @@ _type = type  # Allows for easy mocking of type.
 def build_setup_cfg_command_class(
         setup_command_cfg: SetupCfgCommandConfig
 ) -> Type[Command]:
-    setup_klass = _type(
-        'SetupCfgCommand',
-        (object,),
+    klass_name = '%sCommand' % setup_command_cfg.camel
+    klass = _type(
+        klass_name,
+        (_SetupCfgCommand,),
         {
-            '__annotations__': {
-                'name': ClassVar[str],
-                'root_path': ClassVar[str],
-                'description': ClassVar[str],
-                'user_options': ClassVar[List[str]],
-                'commands': ClassVar[Tuple[str, ...]],
-            },
             '__module__': __name__,
             '__doc__': None,
             'name': setup_command_cfg.name,
-            'root_path': '',
             'description': setup_command_cfg.description,
             'user_options': [],
             'commands': setup_command_cfg.commands,
-            'initialize_options': _initialize_options,
-            'finalize_options': _finalize_options,
-            'run': _run,
+            'parallel': setup_command_cfg.parallel,
         }
     )
-    klass_name = '%sCommand' % setup_command_cfg.camel
-    klass = _type(klass_name, (setup_klass, Command), {})
     return klass
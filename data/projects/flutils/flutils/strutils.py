@@ -1,4 +1,8 @@
-import re
+import string
+from sys import hexversion
+from typing import List
+
+from flutils.codecs.raw_utf8_escape import decode as _raw_utf8_escape_decode
 
 __all__ = [
     'as_escaped_unicode_literal',
@@ -10,6 +14,36 @@ __all__ = [
 ]
 
 
+# The escaped literal of each character in the Latin-1 range.
+_LATIN1_LITERALS = {i: '\\x%02x' % i for i in range(0x100)}
+
+
+def _as_unicode_literal(code_point: int) -> str:
+    if code_point < 0x100:
+        return '\\x%02x' % code_point
+    if code_point < 0x10000:
+        return '\\u%04x' % code_point
+    return '\\U%08x' % code_point
+
+
+class _UnicodeLiterals(dict):
+    """A :obj:`str.translate` table of escaped Unicode literals that adds
+    each missing code point's literal as it's first used.
+    """
+
+    def __missing__(self, code_point: int) -> str:
+        out = _as_unicode_literal(code_point)
+        self[code_point] = out
+        return out
+
+
+_UNICODE_LITERALS = _UnicodeLiterals(_LATIN1_LITERALS)
+
+# If the python version is >= 3.8; str.isascii() and the bytes.hex()
+# separator argument are available.
+_HAS_ASCII_HEX = hexversion >= 0x03080000
+
+
 def as_escaped_unicode_literal(
         text: str
 ) -> str:
@@ -31,17 +65,12 @@ def as_escaped_unicode_literal(
         >>> as_literal(t)
         '\\\\x31\\\\x2e\\\\u2605\\\\x20\\\\U0001f6d1'
     """
-    out = ''
-    for c in text:
-        c_hex = hex(ord(c))[2:]
-        c_len = len(c_hex)
-        if c_len in (1, 2):
-            out += '\\x{:0>2}'.format(c_hex)
-        elif c_len in (3, 4):
-            out += '\\u{:0>4}'.format(c_hex)
-        else:
-            out += '\\U{:0>8}'.format(c_hex)
-    return out
+    if _HAS_ASCII_HEX is True and text and text.isascii():
+        # Each hexadecimal pair, of the ASCII bytes, is separated with a
+        # space which is then replaced with the escape.
+        text_hex = text.encode('ascii').hex(' ')  # type: ignore[call-arg]
+        return '\\x' + text_hex.replace(' ', '\\x')
+    return text.translate(_UNICODE_LITERALS)
 
 
 def as_escaped_utf8_literal(
@@ -65,16 +94,22 @@ def as_escaped_utf8_literal(
         '\\\\x31\\\\x2e\\\\xe2\\\\x98\\\\x85\\\\x20\\\\xf0\\\\x9f\\\\x9b
         \\\\x91'
     """
-    out = ''
     text_bytes = text.encode('utf8')
-    for c in text_bytes:
-        out += '\\%s' % hex(c)[1:]
-    return out
+    if _HAS_ASCII_HEX is True:
+        if not text_bytes:
+            return ''
+        # The hexadecimal pairs are separated with a space which is then
+        # replaced with the escape.
+        text_hex = text_bytes.hex(' ')  # type: ignore[call-arg]
+        return '\\x' + text_hex.replace(' ', '\\x')
+    # Each UTF-8 byte maps to the Latin-1 character of the same value;
+    # which already has a precomputed literal.
+    return text_bytes.decode('latin-1').translate(_LATIN1_LITERALS)
 
 
-_CAMEL_TO_UNDERSCORE_RE = re.compile(
-    '((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))'
-)
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_LOWER_DIGITS = _ASCII_LOWER | frozenset(string.digits)
 
 
 # noinspection PySameParameterValue
@@ -94,7 +129,18 @@ def camel_to_underscore(
         >>> camel_to_underscore('FooBar')
         'foo_bar'
     """
-    return _CAMEL_TO_UNDERSCORE_RE.sub(r'_\1', text).lower()
+    # An underscore is put before each (ASCII) uppercase character that
+    # follows a lowercase character or digit; or, that is not the first
+    # character and is followed by a lowercase character.
+    out: List[str] = []
+    last = len(text) - 1
+    for i, c in enumerate(text):
+        if c in _ASCII_UPPER and i > 0 and (
+                text[i - 1] in _ASCII_LOWER_DIGITS or
+                (i < last and text[i + 1] in _ASCII_LOWER)):
+            out.append('_')
+        out.append(c)
+    return ''.join(out).lower()
 
 
 def convert_escaped_unicode_literal(
@@ -202,10 +248,10 @@ def convert_escaped_utf8_literal(
             >>> convert_escaped_utf8_literal(a)
             'test©'
     """
-    from flutils.codecs import register_codecs  # pylint:disable=C0415
-    register_codecs()
+    # The codec's decode function is called directly; so, the codec does
+    # not need to be registered or looked up in the codec registry.
     text_bytes = text.encode('utf-8')
-    text = text_bytes.decode('raw_utf8_escape')
+    text, _ = _raw_utf8_escape_decode(text_bytes)
     return text
 
 
@@ -230,7 +276,9 @@ def underscore_to_camel(
         >>> underscore_to_camel('_one__two___',lower_first=False)
         'OneTwo'
     """
-    out = ''.join([x.capitalize() or '' for x in text.split('_')])
+    # str.title() is not used here because it also capitalizes letters that
+    # follow digits, apostrophes and other uncased characters.
+    out = ''.join(map(str.capitalize, text.split('_')))
     if lower_first is True:
         return out[:1].lower() + out[1:]
     return out
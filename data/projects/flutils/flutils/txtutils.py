@@ -1,8 +1,11 @@
 # type: ignore[override]
 
 import re
-from itertools import chain
-from sys import hexversion
+from array import array
+from itertools import (
+    accumulate,
+    takewhile,
+)
 from textwrap import TextWrapper
 from typing import (
     List,
@@ -11,12 +14,6 @@ from typing import (
     cast,
 )
 
-# If the python version is >= 3.8
-if hexversion >= 0x03080000:
-    from functools import cached_property
-else:
-    from .decorators import cached_property  # type: ignore[misc]
-
 __all__ = ['len_without_ansi', 'AnsiTextWrapper']
 
 _ANSI_RE = re.compile('(\x1b\\[[0-9;:]+[ABCDEFGHJKSTfhilmns])')
@@ -41,18 +38,40 @@ def len_without_ansi(seq: Sequence) -> int:
         >>> len_without_ansi(text)
         6
     """
+    # Without an escape character there can't be any ANSI codes; so, the
+    # (much more expensive) regex scan can be skipped.
     if hasattr(seq, 'capitalize'):
         _text: str = cast(str, seq)
-        seq = [c for c in _ANSI_RE.split(_text) if c]
-    seq = [c for c in chain(*map(_ANSI_RE.split, seq)) if c]
+        if '\x1b' not in _text:
+            return len(_text)
+        return _len_without_ansi(_text)
     seq = cast(Sequence[str], seq)
+    if not any('\x1b' in c for c in seq):
+        return sum(map(len, seq))
+    return sum(map(_len_without_ansi, seq))
+
+
+def _len_without_ansi(text: str) -> int:
+    # This gives the same result as adding up the length of each part,
+    # from _ANSI_RE.split(), that is not a '\x1b[...m' code.  But, the
+    # parts are measured by their offsets instead of being built; and,
+    # the checks are done inline to avoid a function call per part.
     out = 0
-    for text in seq:
-        if hasattr(text, 'capitalize'):
-            if text.startswith('\x1b[') and text.endswith('m'):
-                continue
-            else:
-                out += len(text)
+    pos = 0
+    startswith = text.startswith
+    for match in _ANSI_RE.finditer(text):
+        start, end = match.span()
+        if start > pos and not (
+                text[start - 1] == 'm' and startswith('\x1b[', pos, start)):
+            out += start - pos
+        # Every match starts with '\x1b['.
+        if text[end - 1] != 'm':
+            out += end - start
+        pos = end
+    end = len(text)
+    if end > pos and not (
+            text[end - 1] == 'm' and startswith('\x1b[', pos, end)):
+        out += end - pos
     return out
 
 
@@ -195,8 +214,11 @@ class AnsiTextWrapper(TextWrapper):
             placeholder: str = ' [...]'
     ) -> None:
         self.__initial_indent: str = ''
+        self.initial_indent_len: int = 0
         self.__subsequent_indent: str = ''
+        self.subsequent_indent_len: int = 0
         self.__placeholder: str = ''
+        self.placeholder_len: int = 0
         self.width: int = width
         self.initial_indent = initial_indent
         self.subsequent_indent = subsequent_indent
@@ -216,15 +238,15 @@ class AnsiTextWrapper(TextWrapper):
 
     @initial_indent.setter
     def initial_indent(self, value: str) -> None:
+        if value == self.__initial_indent:
+            return
         self.__initial_indent = value
-        if 'initial_indent_len' in self.__dict__.keys():
-            del self.__dict__['initial_indent_len']
-
-    @cached_property
-    def initial_indent_len(self) -> int:
-        if not self.initial_indent:
-            return 0
-        return len_without_ansi(self.initial_indent)
+        # The length is set here, as a plain attribute, so that reading
+        # it does not go through a descriptor.
+        if not value:
+            self.initial_indent_len = 0
+        else:
+            self.initial_indent_len = len_without_ansi(value)
 
     @property  # type: ignore[override]
     def subsequent_indent(self) -> str:  # type: ignore
@@ -232,15 +254,13 @@ class AnsiTextWrapper(TextWrapper):
 
     @subsequent_indent.setter
     def subsequent_indent(self, value: str) -> None:
+        if value == self.__subsequent_indent:
+            return
         self.__subsequent_indent = value
-        if 'subsequent_indent_len' in self.__dict__.keys():
-            del self.__dict__['subsequent_indent_len']
-
-    @cached_property
-    def subsequent_indent_len(self) -> int:
-        if not self.subsequent_indent:
-            return 0
-        return len_without_ansi(self.subsequent_indent)
+        if not value:
+            self.subsequent_indent_len = 0
+        else:
+            self.subsequent_indent_len = len_without_ansi(value)
 
     @property  # type: ignore[override]
     def placeholder(self) -> str:  # type: ignore
@@ -248,40 +268,42 @@ class AnsiTextWrapper(TextWrapper):
 
     @placeholder.setter
     def placeholder(self, value: str) -> None:
+        if value == self.__placeholder:
+            return
         self.__placeholder = value
-        if 'placeholder_len' in self.__dict__.keys():
-            del self.__dict__['placeholder_len']
-
-    @cached_property
-    def placeholder_len(self) -> int:
-        if not self.placeholder.lstrip():
-            return 0
-        return len_without_ansi(self.placeholder)
+        if not value.lstrip():
+            self.placeholder_len = 0
+        else:
+            self.placeholder_len = len_without_ansi(value)
 
     def _split(self, text: str) -> List[str]:
         """Override to split on ANSI codes."""
         chunks = super()._split(text)
-        # The following code describes the following list comprehension:
-        #
-        # for chunk in chunks:
-        #     for c in _ANSI_RE.split(chunk):
-        #         if c:
-        #             out.append(c)
-        # return out
-        return [c for c in chain(*map(_ANSI_RE.split, chunks)) if c]
+        out: List[str] = []
+        # Bind the split method to a local; it's used in the loop.
+        split_ansi = _ANSI_RE.split
+        for chunk in chunks:
+            # Most chunks do not contain an ANSI code; so, only the chunks
+            # that contain an ESC character are split.
+            if '\x1b' in chunk:
+                out.extend(c for c in split_ansi(chunk) if c)
+            else:
+                out.append(chunk)
+        return out
 
     def _wrap_chunks(self, chunks: List[str]) -> List[str]:
 
+        # Bind len_without_ansi to a local; it's used throughout the loop.
+        ansi_len = len_without_ansi
         lines = []
         if self.width <= 0:
             raise ValueError("invalid width %r (must be > 0)" % self.width)
         if self.max_lines is not None:
             if self.max_lines > 1:
-                indent = self.subsequent_indent
+                indent_len = self.subsequent_indent_len
             else:
-                indent = self.initial_indent
-            indent_len = len_without_ansi(indent)
-            _placeholder_len = len_without_ansi(self.placeholder.lstrip())
+                indent_len = self.initial_indent_len
+            _placeholder_len = ansi_len(self.placeholder.lstrip())
             if indent_len + _placeholder_len > self.width:
                 raise ValueError('placeholder too large for max width')
             del _placeholder_len
@@ -290,53 +312,72 @@ class AnsiTextWrapper(TextWrapper):
         # from a stack of chucks.
         chunks.reverse()
 
+        # The length (without ANSI codes) of each chunk is only figured
+        # once.  The lengths are kept in arrays, of C longs, that parallel
+        # the chunks and the current line's chunks.
+        chunk_lens = array('l', map(ansi_len, chunks))
+
+        # The maximum width of the first line and of each following line.
+        initial_width = self.width - self.initial_indent_len
+        subsequent_width = self.width - self.subsequent_indent_len
+
         while chunks:
 
             # Start the list of chunks that will make up the current line.
             # cur_len is just the length of all the chunks in cur_line.
             cur_line = []
+            cur_line_lens = array('l')
             cur_len = 0
 
             # Figure out which static string will prefix this line.
+            # Also, the maximum width for this line.
             if lines:
                 indent = self.subsequent_indent
+                width = subsequent_width
             else:
                 indent = self.initial_indent
-
-            indent_len = len_without_ansi(indent)
-
-            # Maximum width for this line.
-            width = self.width - indent_len
+                width = initial_width
 
             # First chunk on line is whitespace -- drop it, unless this
             # is the very beginning of the text (ie. no lines started yet).
             if self.drop_whitespace and chunks[-1].strip() == '' and lines:
                 del chunks[-1]
+                del chunk_lens[-1]
 
-            while chunks:
-                l = len_without_ansi(chunks[-1])
-
-                # Can at least squeeze this chunk onto the current line.
-                if cur_len + l <= width:
-                    cur_line.append(chunks.pop())
-                    cur_len += l
-                    continue
-
-                # Nope, this line is full.
-                else:
-                    break
+            # Squeeze as many chunks as can fit onto the current line.  The
+            # running total of the chunk lengths, from the top of the stack,
+            # is taken while it is less than or equal to the width.
+            totals = list(
+                takewhile(width.__ge__, accumulate(reversed(chunk_lens)))
+            )
+            if totals:
+                count = len(totals)
+                cur_line = chunks[:-count - 1:-1]
+                cur_line_lens = chunk_lens[:-count - 1:-1]
+                cur_len = totals[-1]
+                del chunks[-count:]
+                del chunk_lens[-count:]
 
             # The current line is full, and the next chunk is too big to
             # fit on *any* line (not just this one).
-            if chunks and len_without_ansi(chunks[-1]) > width:
+            if chunks and chunk_lens[-1] > width:
                 self._handle_long_word(chunks, cur_line, cur_len, width)
-                cur_len = sum(map(len_without_ansi, cur_line))
+                # The last chunk may have been split or moved onto the
+                # current line.
+                if len(chunks) < len(chunk_lens):
+                    del chunk_lens[-1]
+                elif chunks:
+                    chunk_lens[-1] = ansi_len(chunks[-1])
+                cur_line_lens.extend(
+                    map(ansi_len, cur_line[len(cur_line_lens):])
+                )
+                cur_len = sum(cur_line_lens)
 
             # If the last chunk on this line is all whitespace, drop it.
             if (self.drop_whitespace and
                     cur_line and
                     cur_line[-1].strip() == ''):
-                cur_len -= len_without_ansi(cur_line[-1])
+                cur_len -= cur_line_lens.pop()
                 del cur_line[-1]
 
             if cur_line:
@@ -368,7 +409,7 @@ class AnsiTextWrapper(TextWrapper):
                             lines.append(indent + ''.join(cur_line))
                             break
 
-                        cur_len -= len_without_ansi(cur_line[-1])
+                        cur_len -= cur_line_lens.pop()
                         # delete the current line's last chunk
                         del cur_line[-1]
 
@@ -379,7 +420,7 @@ class AnsiTextWrapper(TextWrapper):
                             # Get the previous line
                             prev_line = lines[-1].rstrip()
                             # Get the previous line length
-                            prev_line_len = len_without_ansi(prev_line)
+                            prev_line_len = ansi_len(prev_line)
 
                             # If the previous line's length plus the
                             # placeholder's length is less than the
@@ -1,12 +1,17 @@
 import keyword
 from collections import UserString
-from typing import Union
+from functools import lru_cache
+from typing import (
+    Optional,
+    Union,
+)
 
 
 __all__ = ['validate_identifier']
 
 
-_BUILTIN_NAMES = tuple(filter(
+# A frozenset gives a constant time membership test.
+_BUILTIN_NAMES = frozenset(filter(
     lambda x: x.startswith('__') and x.endswith('__'),
     dir('__builtins__')
 ))
@@ -49,33 +54,47 @@ def validate_identifier(
             "The given 'identifier' must be a 'str'.  Got: %r"
             % type(identifier).__name__
         )
-    identifier = identifier.strip()
+    message = _get_identifier_error(
+        identifier.strip(),
+        allow_underscore is not False
+    )
+    if message:
+        raise SyntaxError(message)
+
+
+# The same identifiers are often validated many times (e.g. namedtuple
+# keys); so, the error message (or None) of each is cached.  The message,
+# rather than the exception, is cached so a fresh exception is raised
+# each time.
+@lru_cache(maxsize=1024)
+def _get_identifier_error(
+        identifier: str,
+        allow_underscore: bool
+) -> Optional[str]:
     if not identifier:
-        raise SyntaxError("The given 'identifier' cannot be empty")
+        return "The given 'identifier' cannot be empty"
 
     if allow_underscore is False and identifier[0:1] == '_':
-        raise SyntaxError(
+        return (
             f"The given 'identifier', {identifier!r}, cannot start with an "
             "underscore '_'"
         )
 
-    if identifier[0:1].isdigit():
-        raise SyntaxError(
-            f"The given 'identifier', {identifier!r}, cannot start with a "
-            "number"
-        )
-
-    if not identifier.isidentifier():
-        raise SyntaxError(
-            f"The given 'identifier', {identifier!r}, is invalid."
-        )
-
+    # The cheap hash lookups are done first.  Every keyword and builtin
+    # name is a valid identifier; so, this order gives the same errors.
     if keyword.iskeyword(identifier):
-        raise SyntaxError(
-            f"The given 'identifier', {identifier!r}, cannot be a keyword"
-        )
+        return f"The given 'identifier', {identifier!r}, cannot be a keyword"
 
     if identifier in _BUILTIN_NAMES:
-        raise SyntaxError(
+        return (
             f"The given 'identifier', {identifier!r}, cannot be a builtin name"
         )
+
+    if not identifier.isidentifier():
+        if identifier[0:1].isdigit():
+            return (
+                f"The given 'identifier', {identifier!r}, cannot start with a "
+                "number"
+            )
+        return f"The given 'identifier', {identifier!r}, is invalid."
+    return None
@@ -1,43 +1,40 @@
 import base64
+import codecs
 import pickle
 import unittest
-from collections import UserString
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     NamedTuple,
+    Tuple,
 )
 
+# noinspection PyProtectedMember
 from flutils.codecs.b64 import (
+    _get_codec_info,
     decode,
     encode,
     register,
 )
 
-register()
-NAME = 'b64'
+from .userstrings import USER_STRING_CLS
 
+NAME = 'b64'
 
-class AString(UserString):
-    pass
 
+def setUpModule() -> None:  # pylint: disable=C0103
+    register()
 
-class AStringPatched(UserString):
 
-    # Need to add the encode method because of:
-    #     https://bugs.python.org/issue36582
-    #
-    # The pull request of the fix:
-    #    https://github.com/python/cpython/pull/13138
-    #
-    # As of 2019-06-26 the fix has not been
-    # implemented.
-    #
-    # The bug is a result of the UserString.encode
-    # method not returning bytes.
-    def encode(self, *args, **kwargs) -> bytes:
-        return self.data.encode(*args, **kwargs)
+def tearDownModule() -> None:  # pylint: disable=C0103
+    # Remove the codec's search function so the registration does not
+    # leak into other test modules.  codecs.unregister() was added in
+    # Python 3.10.
+    unregister = getattr(codecs, 'unregister', None)
+    if unregister is not None:
+        unregister(_get_codec_info)
 
 
 class Values(NamedTuple):
@@ -56,23 +53,16 @@ TEST_VALUES: List[Values] = []
 def _wrap(data: str) -> str:
     combined_length = len(data) + 4
     if combined_length > 60:
-        out = ''
-        tmp_data = data
-        while tmp_data:
-            if len(tmp_data) > 56:
-                out += "    %s\n" % tmp_data[0:56]
-                tmp_data = tmp_data[56:]
-            else:
-                out += "    %s\n" % tmp_data
-                tmp_data = ''
-        return out
+        return ''.join(
+            "    %s\n" % data[i:i + 56] for i in range(0, len(data), 56)
+        )
     return data
 
 
-def _build_value(obj: Any) -> Values:
+def _build_value(obj: Any, obj_bytes: bytes) -> Values:
 
     kwargs: Dict[str, Any] = dict(obj=obj)
-    kwargs['obj_bytes'] = pickle.dumps(obj)
+    kwargs['obj_bytes'] = obj_bytes
     kwargs['obj_bytes_len'] = len(kwargs['obj_bytes'])
     kwargs['b64_bytes'] = base64.b64encode(kwargs['obj_bytes'])
     kwargs['b64_str'] = kwargs['b64_bytes'].decode('utf-8')
@@ -82,161 +72,105 @@ def _build_value(obj: Any) -> Values:
     return out
 
 
-def _add_value(obj: Any) -> None:
-    vals = _build_value(obj)
+def _add_value(obj: Any, obj_bytes: bytes) -> None:
+    vals = _build_value(obj, obj_bytes)
     TEST_VALUES.append(vals)
 
 
-_add_value('Test')
+# Each given obj_bytes is the value of: pickle.dumps(obj, protocol=2)
+_add_value('Test', b'\x80\x02X\x04\x00\x00\x00Testq\x00.')
 _add_value(
     'Testing One Two Three Four Five Six Seven Eight Nine Ten Eleven Twelve'
-    'Thirteen Fourteen Fifteen Sixteen Seventeen Eighteen Nineteen Twenty'
+    'Thirteen Fourteen Fifteen Sixteen Seventeen Eighteen Nineteen Twenty',
+    b'\x80\x02X\x8a\x00\x00\x00'
+    b'Testing One Two Three Four Five Six Seven Eight Nine Ten Eleven Twelve'
+    b'Thirteen Fourteen Fifteen Sixteen Seventeen Eighteen Nineteen Twenty'
+    b'q\x00.'
+)
+_add_value(1, b'\x80\x02K\x01.')
+_add_value(True, b'\x80\x02\x88.')
+_add_value(None, b'\x80\x02N.')
+_add_value(
+    dict(a=1, b=2),
+    b'\x80\x02}q\x00(X\x01\x00\x00\x00aq\x01K\x01X\x01\x00\x00\x00bq\x02K'
+    b'\x02u.'
 )
-_add_value(1)
-_add_value(True)
-_add_value(None)
-_add_value(dict(a=1, b=2))
+
+
+def _round_trip(
+        obj_bytes: bytes,
+        encoder: Callable[[str], Tuple[bytes, int]],
+        decoder: Callable[[bytes], Tuple[str, int]]
+) -> Any:
+    # Decode the given pickled bytes into base64 characters; encode
+    # them back into bytes; and, unpickle the result.
+    b64_str = decoder(obj_bytes)[0]
+    return pickle.loads(encoder(b64_str)[0])
 
 
 class TestB64(unittest.TestCase):
 
+    def setUp(self) -> None:
+        # The registered codec's functions are looked up once, through
+        # the codec registry, instead of on every call.
+        self.registered_encode = codecs.getencoder(NAME)
+        self.registered_decode = codecs.getdecoder(NAME)
+
     def test_encode_value_bytes(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = encode(v.b64_str_wrapped)[0]
-                self.assertEqual(
-                    ret,
-                    v.obj_bytes,
-                    msg=(
-                        f'\n\n'
-                        f'encode({v.b64_str!r})[0]\n\n'
-                        f'expected: {v.obj_bytes!r}\n\n'
-                        f'     got: {ret!r}\n\n'
-                    )
-                )
+        # All of the values are compared at once.  On failure, the
+        # list diff shows which of the TEST_VALUES differ.
+        ret = [encode(v.b64_str_wrapped)[0] for v in TEST_VALUES]
+        exp = [v.obj_bytes for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_encode_consumed_value(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = encode(v.b64_str)[1]
-                self.assertEqual(
-                    ret,
-                    v.b64_str_len,
-                    msg=(
-                        f'\n\n'
-                        f'encode({v.b64_str!r})[1]\n\n'
-                        f'expected: {v.b64_str_len!r}\n\n'
-                        f'     got: {ret!r}\n\n'
-                    )
-                )
+        ret = [encode(v.b64_str)[1] for v in TEST_VALUES]
+        exp = [v.b64_str_len for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_decode_value_bytes(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = decode(v.obj_bytes)[0]
-                self.assertEqual(
-                    ret,
-                    v.b64_str,
-                    msg=(
-                        f'\n\n'
-                        f'decode({v.obj_bytes!r})[0]\n\n'
-                        f'expected: {v.b64_str!r}\n\n'
-                        f'     got: {ret!r}\n\n'
-                    )
-                )
+        ret = [decode(v.obj_bytes)[0] for v in TEST_VALUES]
+        exp = [v.b64_str for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_decode_consumed_value(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = decode(v.obj_bytes)[1]
-                self.assertEqual(
-                    ret,
-                    v.obj_bytes_len,
-                    msg=(
-                        f'\n\n'
-                        f'decode({v.obj_bytes!r})[1]\n\n'
-                        f'expected: {v.obj_bytes_len!r}\n\n'
-                        f'     got: {ret!r}\n\n'
-                    )
-                )
+        ret = [decode(v.obj_bytes)[1] for v in TEST_VALUES]
+        exp = [v.obj_bytes_len for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_registered_encode_value(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = v.b64_str_wrapped.encode(NAME)
-                self.assertEqual(
-                    ret,
-                    v.obj_bytes,
-                    msg=(
-                        f'\n\n'
-                        f'{v.b64_str_wrapped!r}).encode({NAME!r})\n\n'
-                        f'expected: {v.obj_bytes!r}\n\n'
-                        f'     got: {ret!r}\n\n'
-                    )
-                )
+        enc = self.registered_encode
+        ret = [enc(v.b64_str_wrapped)[0] for v in TEST_VALUES]
+        exp = [v.obj_bytes for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_registered_decode_value(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = v.obj_bytes.decode(NAME)
-                self.assertEqual(
-                    ret,
-                    v.b64_str,
-                    msg=(
-                        f'\n\n'
-                        f'{v.obj_bytes!r}).encode({NAME!r})\n\n'
-                        f'expected: {v.b64_str!r}\n\n'
-                        f'     got: {ret!r}\n\n'
-                    )
-                )
+        dec = self.registered_decode
+        ret = [dec(v.obj_bytes)[0] for v in TEST_VALUES]
+        exp = [v.b64_str for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_encode_user_string(self) -> None:
-        # This test is setup to get around the bug:
-        # https://bugs.python.org/issue36582
-        # This test will also work once the bug has
-        # been fixed.
-        arg = 'Testing1'
-        cls = AString
-        obj = AString(arg)
-
-        # Verify that encode returns bytes.  If not,
-        # then use the patched UserString.
-        chk = obj.encode('utf-8')
-        if isinstance(chk, bytes) is False:
-            cls = AStringPatched
-            obj = AStringPatched(arg)
-
-        # Perform the test
         for v in TEST_VALUES:
             with self.subTest(v=v):
-                obj = cls(v.b64_str_wrapped)
-                ret = obj.encode(NAME)
-                self.assertEqual(
-                    ret,
-                    v.obj_bytes,
-                    msg=(
-                        f'\n\n'
-                        f'{obj!r}).encode({NAME!r})\n\n'
-                        f'expected: {v.obj_bytes!r}\n\n'
-                        f'     got: {ret!r}\n\n'
-                    )
-                )
+                obj = USER_STRING_CLS(v.b64_str_wrapped)
+                self.assertEqual(obj.encode(NAME), v.obj_bytes)
 
     def test_end_to_end(self) -> None:
         for v in TEST_VALUES:
             with self.subTest(v=v):
-                b64_str = v.obj_bytes.decode(NAME)
-                obj_bytes = b64_str.encode(NAME)
-                ret = pickle.loads(obj_bytes)
-                self.assertEqual(
-                    ret,
-                    v.obj,
-                    msg=(
-                        f'\n\n'
-                        f'expected: {v.obj!r}\n\n'
-                        f'     got: {ret!r}\n\n'
-                    )
+                ret = _round_trip(
+                    v.obj_bytes,
+                    self.registered_encode,
+                    self.registered_decode
                 )
+                self.assertEqual(ret, v.obj)
+
+    def test_registered_round_trip(self) -> None:
+        # Goes through bytes.decode() and str.encode() by codec name.
+        ret = [v.obj_bytes.decode(NAME).encode(NAME) for v in TEST_VALUES]
+        exp = [v.obj_bytes for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_raises_unicode_encode_error(self) -> None:
         val = '{foo}'
@@ -1,11 +1,14 @@
+import codecs
 import unittest
-from collections import UserString
 from typing import (
     NamedTuple,
     Tuple,
 )
 
-from flutils.codecs import register_codecs
+from flutils.codecs import (
+    b64,
+    register_codecs,
+)
 # noinspection PyProtectedMember
 from flutils.codecs.raw_utf8_escape import (
     NAME,
@@ -14,6 +17,8 @@ from flutils.codecs.raw_utf8_escape import (
     encode,
 )
 
+from .userstrings import USER_STRING_CLS
+
 
 class Values(NamedTuple):
     txt_str: str
@@ -23,6 +28,12 @@ class Values(NamedTuple):
 
 
 TEST_VALUES: Tuple[Values, ...] = (
+    Values(
+        '',
+        b'',
+        0,
+        0,
+    ),
     Values(
         'Test',
         b'Test',
@@ -59,151 +70,67 @@ TEST_VALUES: Tuple[Values, ...] = (
     )
 
 )
-register_codecs()
-
 
-class AString(UserString):
-    pass
 
+def setUpModule() -> None:  # pylint: disable=C0103
+    register_codecs()
 
-class AStringPatched(UserString):
 
-    # Need to add the encode method because of:
-    #     https://bugs.python.org/issue36582
-    #
-    # The pull request of the fix:
-    #    https://github.com/python/cpython/pull/13138
-    #
-    # The bug is a result of the UserString.encode
-    # method not returning bytes.
-    def encode(self, *args, **kwargs) -> bytes:
-        return self.data.encode(*args, **kwargs)
+def tearDownModule() -> None:  # pylint: disable=C0103
+    # Remove the search functions added by register_codecs().
+    # codecs.unregister() was added in Python 3.10.
+    unregister = getattr(codecs, 'unregister', None)
+    if unregister is not None:
+        unregister(_get_codec_info)
+        # noinspection PyProtectedMember
+        unregister(b64._get_codec_info)
 
 
 class TestRawUtf8Escape(unittest.TestCase):
 
     def test_encode_value_bytes(self) -> None:
-        for v in TEST_VALUES:
-            ret = encode(v.txt_str)[0]
-            self.assertEqual(
-                ret,
-                v.txt_bytes,
-                msg=(
-                    f'\n\n'
-                    f'encode({v.txt_str!r})[0]\n\n'
-                    f'expected: {v.txt_bytes!r}\n\n'
-                    f'     got: {ret!r}\n\n'
-                )
-            )
+        # All of the values are compared at once.  On failure, the
+        # list diff shows which of the TEST_VALUES differ.
+        ret = [encode(v.txt_str)[0] for v in TEST_VALUES]
+        exp = [v.txt_bytes for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_encode_consumed_value(self) -> None:
-        for v in TEST_VALUES:
-            ret = encode(v.txt_str)[1]
-            self.assertEqual(
-                ret,
-                v.txt_str_len,
-                msg=(
-                    f'\n\n'
-                    f'encode({v.txt_str!r})[1]\n\n'
-                    f'expected: {v.txt_str_len!r}\n\n'
-                    f'     got: {ret!r}\n\n'
-                )
-            )
+        ret = [encode(v.txt_str)[1] for v in TEST_VALUES]
+        exp = [v.txt_str_len for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_encode_raises_unicode_encode_error(self) -> None:
         with self.assertRaises(UnicodeEncodeError):
             encode('Hello\\x80')
 
     def test_decode_value_bytes(self) -> None:
-        for v in TEST_VALUES:
-            ret = decode(v.txt_bytes)[0]
-            self.assertEqual(
-                ret,
-                v.txt_str,
-                msg=(
-                    f'\n\n'
-                    f'decode({v.txt_bytes!r})[0]\n\n'
-                    f'expected: {v.txt_str!r}\n\n'
-                    f'     got: {ret!r}\n\n'
-                )
-            )
+        ret = [decode(v.txt_bytes)[0] for v in TEST_VALUES]
+        exp = [v.txt_str for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_decode_consumed_value(self) -> None:
-        for v in TEST_VALUES:
-            ret = decode(v.txt_bytes)[1]
-            self.assertEqual(
-                ret,
-                v.txt_bytes_len,
-                msg=(
-                    f'\n\n'
-                    f'decode({v.txt_bytes!r})[1]\n\n'
-                    f'expected: {v.txt_bytes_len!r}\n\n'
-                    f'     got: {ret!r}\n\n'
-                )
-            )
+        ret = [decode(v.txt_bytes)[1] for v in TEST_VALUES]
+        exp = [v.txt_bytes_len for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_encode_raises_unicode_decode_error(self) -> None:
         with self.assertRaises(UnicodeDecodeError):
             decode(b'Hello\\x80')
 
     def test_registered_encode_value(self) -> None:
-        for v in TEST_VALUES:
-            ret = v.txt_str.encode(NAME)
-            self.assertEqual(
-                ret,
-                v.txt_bytes,
-                msg=(
-                    f'\n\n'
-                    f'{v.txt_str!r}.encode({NAME!r})\n\n'
-                    f'expected: {v.txt_bytes!r}\n\n'
-                    f'     got: {ret!r}\n\n'
-                )
-            )
+        ret = [v.txt_str.encode(NAME) for v in TEST_VALUES]
+        exp = [v.txt_bytes for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_registered_decode_value(self) -> None:
-        for v in TEST_VALUES:
-            ret = v.txt_bytes.decode(NAME)
-            self.assertEqual(
-                ret,
-                v.txt_str,
-                msg=(
-                    f'\n\n'
-                    f'{v.txt_bytes!r}.decode({NAME!r})\n\n'
-                    f'expected: {v.txt_str!r}\n\n'
-                    f'     got: {ret!r}\n\n'
-                )
-            )
+        ret = [v.txt_bytes.decode(NAME) for v in TEST_VALUES]
+        exp = [v.txt_str for v in TEST_VALUES]
+        self.assertEqual(ret, exp)
 
     def test_encode_user_string(self) -> None:
-        # This test is setup to get around the bug:
-        # https://bugs.python.org/issue36582
-        # This test will also work once the bug has
-        # been fixed.
-        arg = 'Testing1'
-        obj = AString(arg)
-
-        # Verify that encode returns bytes.  If not,
-        # then use the patched UserString.
-        chk = obj.encode('utf-8')
-        if isinstance(chk, bytes) is False:
-            obj = AStringPatched(arg)
-
-        # Perform the test
-        exp = b'Testing1'
-        ret = obj.encode(NAME)
-        ret_type = type(ret).__name__
-
-        self.assertEqual(
-            ret,
-            exp,
-            msg=(
-                f'\n\n'
-                f'{arg!r}.encode({NAME!r})\n\n'
-                f'expected: {exp!r}\n\n'
-                f'     got: {ret!r}\n\n'
-                f'    type: {ret_type}\n\n'
-            )
-        )
+        obj = USER_STRING_CLS('Testing1')
+        self.assertEqual(obj.encode(NAME), b'Testing1')
 
     def test_get_codec_info(self) -> None:
         val = _get_codec_info('foo')
@@ -0,0 +1,34 @@
+from collections import UserString
+from typing import Type
+
+
+class AString(UserString):
+    pass
+
+
+class AStringPatched(UserString):
+
+    # Need to add the encode method because of:
+    #     https://bugs.python.org/issue36582
+    #
+    # The pull request of the fix:
+    #    https://github.com/python/cpython/pull/13138
+    #
+    # The bug is a result of the UserString.encode
+    # method not returning bytes.
+    def encode(self, *args, **kwargs) -> bytes:
+        return self.data.encode(*args, **kwargs)
+
+
+def _get_user_string_class() -> Type[UserString]:
+    # Verify that encode returns bytes.  If not,
+    # then use the patched UserString.
+    chk = AString('Testing1').encode('utf-8')
+    if isinstance(chk, bytes) is False:
+        return AStringPatched
+    return AString
+
+
+# The UserString class to use in tests that encode a UserString; which
+# gets around the bug: https://bugs.python.org/issue36582
+USER_STRING_CLS = _get_user_string_class()
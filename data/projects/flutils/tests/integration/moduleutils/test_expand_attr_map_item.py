@@ -1,4 +1,3 @@
-import keyword
 import unittest
 
 from flutils.moduleutils import (
@@ -17,8 +16,8 @@ class Test(unittest.TestCase):
             '',
             item
         )
-        val = list(map(_expand_attr_map_item, (item,)))
-        self.assertEqual(val, [expect])
+        val = _expand_attr_map_item(item)
+        self.assertEqual(val, expect)
 
     def test_integration_expand_attr_map_item_sub_module(self):
         item = 'os.path'
@@ -28,8 +27,8 @@ class Test(unittest.TestCase):
             '',
             item
         )
-        val = list(map(_expand_attr_map_item, (item,)))
-        self.assertEqual(val, [expect])
+        val = _expand_attr_map_item(item)
+        self.assertEqual(val, expect)
 
     def test_integration_expand_attr_map_item_module_attr(self):
         item = 'os.path:dirname'
@@ -40,8 +39,8 @@ class Test(unittest.TestCase):
             item
         )
 
-        val = list(map(_expand_attr_map_item, (item,)))
-        self.assertEqual(val, [expect])
+        val = _expand_attr_map_item(item)
+        self.assertEqual(val, expect)
 
     def test_integration_expand_attr_map_item_alias(self):
         item = 'os, _os'
@@ -52,8 +51,8 @@ class Test(unittest.TestCase):
             item
         )
 
-        val = list(map(_expand_attr_map_item, (item,)))
-        self.assertEqual(val, [expect])
+        val = _expand_attr_map_item(item)
+        self.assertEqual(val, expect)
 
     def test_integration_expand_attr_map_item_sub_module_alias(self):
         item = 'os.path,_path'
@@ -63,8 +62,8 @@ class Test(unittest.TestCase):
             '',
             item
         )
-        val = list(map(_expand_attr_map_item, (item,)))
-        self.assertEqual(val, [expect])
+        val = _expand_attr_map_item(item)
+        self.assertEqual(val, expect)
 
     def test_integration_expand_attr_map_item_module_attr_alias(self):
         item = 'os.path:dirname,dname'
@@ -74,11 +73,11 @@ class Test(unittest.TestCase):
             'dirname',
             item
         )
-        val = list(map(_expand_attr_map_item, (item,)))
-        self.assertEqual(val, [expect])
+        val = _expand_attr_map_item(item)
+        self.assertEqual(val, expect)
 
     # noinspection PyTypeChecker
     def test_integration_expand_attr_map_item_not_string_error(self):
         msg = "name=1"
         with self.assertRaises(AttributeError, msg=msg):
-            list(map(_expand_attr_map_item, (1, )))
+            _expand_attr_map_item(1)
@@ -5,13 +5,18 @@ from flutils.moduleutils import lazy_import_module
 
 class TestOne(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # The lazy modules are set up once for the class.  Each module is
+        # only used (and loaded) by one of the tests.
         paths = __name__.split('.')
         paths.pop(-1)
-        self.package = '.'.join(paths)
+        cls.package = '.'.join(paths)
+        cls.lazy = lazy_import_module('.lazy', package=cls.package)
+        cls.lazy1 = lazy_import_module('.lazy1', package=cls.package)
 
     def test_integration_lazy_import(self):
-        mod = lazy_import_module('.lazy', package=self.package)
+        mod = self.lazy
         mod.test = 6
         mod.a_val = 22
         mod.foo = 33
@@ -26,7 +31,7 @@ class TestOne(unittest.TestCase):
         self.assertEqual(22, mod.a_val)
 
     def test_integration_lazy1_import(self):
-        mod = lazy_import_module('.lazy1', package=self.package)
+        mod = self.lazy1
         mod.test = 6
         mod.a_val = 22
         mod.foo = 33
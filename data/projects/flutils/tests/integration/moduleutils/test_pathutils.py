@@ -1,5 +1,6 @@
 import os
 import unittest
+from itertools import islice
 from pathlib import Path
 
 from flutils.pathutils import (
@@ -22,6 +23,8 @@ class TestTwo(unittest.TestCase):
     def test_integration_path(self):
         val = '~/*'
         try:
-            list(find_paths(val))
+            # Only the first found path is needed to show the search
+            # works; so, the home directory is not fully listed.
+            list(islice(find_paths(val), 1))
         except Exception as e:
             self.fail('There was an exception: %s' % e)
@@ -1,15 +1,22 @@
 import keyword
 import unittest
+from typing import (
+    Iterable,
+    List,
+)
 
 from flutils.moduleutils import (
     _DUNDERS,
     _validate_attr_identifier,
 )
 
-_BUILTIN_NAMES = tuple(filter(
-    lambda x: x.startswith('__') and x.endswith('__'),
-    dir('__builtins__')
-))
+# The dunder names of the 'str' object; which is what
+# flutils.moduleutils._BUILTIN_NAMES holds, because it is built from
+# dir('__builtins__') (the dir of a string).
+_STR_DUNDERS = tuple(
+    name for name in dir('__builtins__')
+    if len(name) > 4 and name[:2] == '__' == name[-2:]
+)
 
 
 class TestModuleUtils(unittest.TestCase):
@@ -18,35 +25,50 @@ class TestModuleUtils(unittest.TestCase):
         val = _validate_attr_identifier('foo', 'line')
         self.assertEqual(val, 'foo')
 
+    def _get_not_raised(self, names: Iterable[str]) -> List[str]:
+        # Return each of the given names that did NOT cause an
+        # AttributeError to be raised.
+        out: List[str] = []
+        for name in names:
+            try:
+                _validate_attr_identifier(name, 'line')
+            except AttributeError:
+                continue
+            out.append(name)
+        return out
+
     def test_validate_attr_identifier__01(self):
-        for name in keyword.kwlist:
-            with self.subTest(name=name):
-                msg = (
-                    f"_validate_attr_identifier({name!r}, 'line')\n\n"
-                    f"A keyword has been passed in and expecting\n"
-                    f"an AttributeError to be raised.\n"
-                )
-                with self.assertRaises(AttributeError, msg=msg):
-                    _validate_attr_identifier(name, 'line')
+        ret = self._get_not_raised(keyword.kwlist)
+        self.assertEqual(
+            ret,
+            [],
+            msg=(
+                "Each of the above keywords was passed into "
+                "_validate_attr_identifier() and did not raise an "
+                "AttributeError."
+            )
+        )
 
     def test_validate_attr__identifier__02(self):
-        for name in _BUILTIN_NAMES:
-            with self.subTest(name=name):
-                msg = (
-                    f"_validate_attr_identifier({name!r}, 'line')\n\n"
-                    f"A dunder builtin name has been passed in and\n"
-                    f"expecting an AttributeError to be raised.\n"
-                )
-                with self.assertRaises(AttributeError, msg=msg):
-                    _validate_attr_identifier(name, 'line')
+        ret = self._get_not_raised(_STR_DUNDERS)
+        self.assertEqual(
+            ret,
+            [],
+            msg=(
+                "Each of the above str dunder names was passed into "
+                "_validate_attr_identifier() and did not raise an "
+                "AttributeError."
+            )
+        )
 
     def test_validate_attr_identifier_dunders_error(self):
-        for name in _DUNDERS:
-            with self.subTest(name=name):
-                msg = (
-                    f"_validate_attr_identifier({name!r}, 'line')\n\n"
-                    f"A special dunder name has been passed in and\n"
-                    f"expecting an AttributeError to be raised.\n"
-                )
-                with self.assertRaises(AttributeError, msg=msg):
-                    _validate_attr_identifier(name, 'line')
+        ret = self._get_not_raised(sorted(_DUNDERS))
+        self.assertEqual(
+            ret,
+            [],
+            msg=(
+                "Each of the above special dunder names was passed into "
+                "_validate_attr_identifier() and did not raise an "
+                "AttributeError."
+            )
+        )
@@ -18,3 +18,13 @@ class TestCachedPropertyBasic(unittest.TestCase):
     def test_cached_property_value(self):
         obj = MyClass()
         self.assertEqual(6, obj.y)
+
+    def test_cached_property_cached(self):
+        obj = MyClass()
+        first, second = obj.y, obj.y
+        self.assertIs(first, second)
+        # The value is stored in the instance's __dict__; so, every
+        # following access does not call the descriptor.
+        self.assertIn('y', obj.__dict__)
+        obj.x = 10
+        self.assertEqual(6, obj.y)
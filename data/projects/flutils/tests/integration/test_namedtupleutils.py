@@ -1,3 +1,4 @@
+import sys
 import unittest
 from collections import (
     OrderedDict,
@@ -81,6 +82,11 @@ class TestToNamedTuple(unittest.TestCase):
         res = to_namedtuple(arg)
         self.assertEqual(res, exp)
 
+    def test_empty_dict_is_shared(self) -> None:
+        res1 = to_namedtuple({})
+        res2 = to_namedtuple({'_a': 1})
+        self.assertIs(res1, res2)
+
     def test_list(self) -> None:
         obj_dict = {
             'b': 2,
@@ -184,3 +190,30 @@ class TestToNamedTuple(unittest.TestCase):
         )
         res = to_namedtuple(arg)
         self.assertEqual(res, exp)
+
+    def test_deeply_nested(self) -> None:
+        depth = sys.getrecursionlimit() * 2
+        arg = {'a': 1}
+        for _ in range(depth):
+            arg = {'a': [arg]}
+        res = to_namedtuple(arg)
+        for _ in range(depth):
+            res = res.a[0]
+        make = namedtuple('NamedTuple', 'a')
+        self.assertEqual(res, make(1))
+
+    def test_self_referencing(self) -> None:
+        arg_list: list = []
+        arg_list.append(arg_list)
+        arg_dict: dict = {'a': 1}
+        arg_dict['b'] = [arg_dict]
+        for arg in (arg_list, arg_dict):
+            with self.subTest(arg=type(arg).__name__):
+                with self.assertRaises(ValueError):
+                    to_namedtuple(arg)
+
+    def test_shared_child(self) -> None:
+        child = {'a': 1}
+        res = to_namedtuple([child, child])
+        make = namedtuple('NamedTuple', 'a')
+        self.assertEqual(res, [make(1), make(1)])
@@ -2,16 +2,18 @@ import unittest
 from collections import (
     ChainMap,
     Counter,
-    KeysView,
     OrderedDict,
     UserDict,
     UserList,
     UserString,
-    ValuesView,
     defaultdict,
     deque,
     namedtuple,
 )
+from collections.abc import (
+    KeysView,
+    ValuesView,
+)
 from datetime import (
     date,
     datetime,
@@ -28,9 +30,21 @@ from flutils.objutils import (
     is_subclass_of_any,
 )
 
+ATTRS_PRESENT = ('get', 'items', 'values', 'keys')
+ATTRS_MISSING = ('get', 'items', 'vals', 'keys')
+ATTRS_ANY_MISS = ('foo', 'vals')
+
+_SAMPLE_DICT = {'a': 1, 'b': 2}
+
+_NT3 = namedtuple('test', 'a, b, c')
+
+_FROZEN_123 = frozenset({1, 2, 3})
+
 
 class MockIterable:
 
+    __slots__ = ('current', 'high')
+
     def __init__(self, low, high):
         self.current = low
         self.high = high
@@ -47,40 +61,39 @@ class MockIterable:
 
 
 class MockObject:
-    pass
+    __slots__ = ()
+
+
+class _DictFixture:
 
+    OBJ = _SAMPLE_DICT
 
-class TestHasAttrs(unittest.TestCase):
+
+class TestHasAttrs(_DictFixture, unittest.TestCase):
 
     def test_integration_has_attrs_true(self):
-        obj = dict(a=1, b=2)
-        self.assertTrue(has_attrs(obj, 'get', 'items', 'values', 'keys'))
+        self.assertTrue(has_attrs(self.OBJ, *ATTRS_PRESENT))
 
     def test_integration_has_attrs_false(self):
-        obj = dict(a=1, b=2)
-        self.assertFalse(has_attrs(obj, 'get', 'items', 'vals', 'keys'))
+        self.assertFalse(has_attrs(self.OBJ, *ATTRS_MISSING))
 
 
-class TestHasAnyAttrs(unittest.TestCase):
+class TestHasAnyAttrs(_DictFixture, unittest.TestCase):
 
     def test_integration_has_any_attrs_true(self):
-        obj = dict(a=1, b=2)
-        self.assertTrue(has_any_attrs(obj, 'get', 'items', 'values', 'keys'))
+        self.assertTrue(has_any_attrs(self.OBJ, *ATTRS_PRESENT))
 
     def test_integration_has_any_attrs_false(self):
-        obj = dict(a=1, b=2)
-        self.assertFalse(has_any_attrs(obj, 'foo', 'vals'))
+        self.assertFalse(has_any_attrs(self.OBJ, *ATTRS_ANY_MISS))
 
 
-class TestHasCallables(unittest.TestCase):
+class TestHasCallables(_DictFixture, unittest.TestCase):
 
     def test_integration_has_callables_true(self):
-        obj = dict(a=1, b=2)
-        self.assertTrue(has_callables(obj, 'get', 'keys', 'items', 'values'))
+        self.assertTrue(has_callables(self.OBJ, *ATTRS_PRESENT))
 
     def test_integration_has_callables_false(self):
-        obj = dict(a=1, b=2)
-        self.assertFalse(has_callables(obj, 'get', 'vals'))
+        self.assertFalse(has_callables(self.OBJ, 'get', 'vals'))
 
     def test_integration_has_callables_non_callable(self):
         obj = SimpleNamespace()
@@ -88,149 +101,95 @@ class TestHasCallables(unittest.TestCase):
         self.assertFalse(has_callables(obj, 'test'))
 
 
-class TestHasAnyCallables(unittest.TestCase):
+class TestHasAnyCallables(_DictFixture, unittest.TestCase):
 
     def test_integration_has_any_callables_true(self):
-        obj = dict(a=1, b=2)
         self.assertTrue(has_any_callables(
-            obj, 'get', 'foo', 'items', 'values'))
+            self.OBJ, 'get', 'foo', 'items', 'values'))
 
     def test_integration_has_any_callables_false(self):
-        obj = dict(a=1, b=2)
-        self.assertFalse(has_any_callables(obj, 'foo', 'bar'))
+        self.assertFalse(has_any_callables(self.OBJ, 'foo', 'bar'))
+
+    def test_integration_has_any_callables_missing_first(self):
+        self.assertTrue(has_any_callables(self.OBJ, 'foo', 'get'))
 
 
 class TestIsSubclassOfAny(unittest.TestCase):
 
     def test_integration_is_subclass_of_any_true(self):
-        obj = dict(a=1, b=2)
         self.assertTrue(
-            is_subclass_of_any(obj.keys(), ValuesView, KeysView, UserList)
+            is_subclass_of_any(
+                _SAMPLE_DICT.keys(), ValuesView, KeysView, UserList
+            )
         )
 
     def test_integration_is_subclass_of_any_false(self):
-        obj = dict(a=1, b=2)
         self.assertFalse(
-            is_subclass_of_any(obj.keys(), ValuesView, UserList)
+            is_subclass_of_any(_SAMPLE_DICT.keys(), ValuesView, UserList)
         )
 
 
+def _build_date():
+    obj = datetime.now()
+    return date(obj.year, obj.month, obj.day)
+
+
 class TestIslistlike(unittest.TestCase):
 
-    def test_integration_is_list_like_list_true(self):
-        obj = [1, 2, 3]
-        self.assertTrue(is_list_like(obj))
-
-    def test_integration_is_list_like_tuple_true(self):
-        obj = (1, 2, 3)
-        self.assertTrue(is_list_like(obj))
-
-    def test_integration_is_list_like_namedtuple_true(self):
-        build = namedtuple('test', 'a, b, c')
-        obj = build(1, 2, 3)
-        self.assertTrue(is_list_like(obj))
-
-    def test_integration_is_list_like_set_true(self):
-        obj = set((1, 2, 3))
-        self.assertTrue(is_list_like(obj))
-
-    def test_integration_is_list_like_frozenset_true(self):
-        obj = frozenset((1, 2, 3))
-        self.assertTrue(is_list_like(obj))
-
-    def test_integration_is_list_like_deque_true(self):
-        obj = deque((1, 2, 3))
-        self.assertTrue(is_list_like(obj))
-
-    def test_integration_is_list_like_iterator_true(self):
-        obj = MockIterable(5, 10)
-        self.assertTrue(is_list_like(obj))
-
-    def test_integration_is_list_like_values_view_true(self):
-        obj = dict(a=1, b=2)
-        self.assertTrue(is_list_like(obj.values()))
-
-    def test_integration_is_list_like_keys_view_true(self):
-        obj = dict(a=1, b=2)
-        self.assertTrue(is_list_like(obj.keys()))
-
-    def test_integration_is_list_like_user_list_true(self):
-        obj = UserList((1, 2, 3))
-        self.assertTrue(is_list_like(obj))
-
-    def test_integration_is_list_like_dict_false(self):
-        obj = dict(a=1, b=2)
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_str_false(self):
-        obj = 'test'
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_bytes_false(self):
-        obj = b'test'
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_int_false(self):
-        obj = 55
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_float_false(self):
-        obj = 55.553
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_decimal_false(self):
-        obj = Decimal('55.23')
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_datetime_false(self):
-        obj = datetime.now()
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_date_false(self):
-        obj = datetime.now()
-        obj = date(obj.year, obj.month, obj.day)
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_bool_false(self):
-        obj = True
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_none_false(self):
-        obj = None
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_object_false(self):
-        obj = MockObject()
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_chain_map_false(self):
-        dict_a = dict(a=1, b=2)
-        dict_b = dict(b=40, c=3, d=4, e=5)
-        obj = ChainMap(dict_a, dict_b)
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_counter_false(self):
-        obj = dict(b=40, c=3, d=4, e=5)
-        obj = Counter(obj)
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_defaultdict_false(self):
-        s = [('yellow', 1), ('blue', 2), ('yellow', 3), ('blue', 4), ('red', 1)]
-        obj = defaultdict(list)
-        for k, v in s:
-            obj[k].append(v)
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_ordered_dict_false(self):
-        obj = dict(b=40, c=3, d=4, e=5)
-        obj = OrderedDict(obj.items())
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_user_dict_false(self):
-        obj = dict(b=40, c=3, d=4, e=5)
-        obj = UserDict(obj.items())
-        self.assertFalse(is_list_like(obj))
-
-    def test_integration_is_list_like_user_string_false(self):
-        obj = UserString('testing')
-        self.assertFalse(is_list_like(obj))
+    TRUE_CASES = (
+        ('list', lambda: [1, 2, 3]),
+        ('tuple', lambda: (1, 2, 3)),
+        ('namedtuple', lambda: _NT3(1, 2, 3)),
+        ('set', lambda: {1, 2, 3}),
+        ('frozenset', lambda: _FROZEN_123),
+        ('deque', lambda: deque((1, 2, 3))),
+        ('iterator', lambda: iter(range(5, 11))),
+        # A plain class that only implements the iterator protocol.
+        ('mock_iterator', lambda: MockIterable(5, 10)),
+        ('values_view', _SAMPLE_DICT.values),
+        ('keys_view', _SAMPLE_DICT.keys),
+        ('user_list', lambda: UserList((1, 2, 3))),
+        ('range', lambda: range(3)),
+    )
+
+    FALSE_CASES = (
+        ('dict', lambda: _SAMPLE_DICT),
+        ('str', lambda: 'test'),
+        ('bytes', lambda: b'test'),
+        ('bytearray', lambda: bytearray(b'test')),
+        ('memoryview', lambda: memoryview(b'test')),
+        ('int', lambda: 55),
+        ('float', lambda: 55.553),
+        ('decimal', lambda: Decimal('55.23')),
+        ('datetime', datetime.now),
+        ('date', _build_date),
+        ('bool', lambda: True),
+        ('none', lambda: None),
+        ('object', MockObject),
+        ('chain_map', lambda: ChainMap(
+            {'a': 1, 'b': 2},
+            {'b': 40, 'c': 3, 'd': 4, 'e': 5}
+        )),
+        ('counter', lambda: Counter({'b': 40, 'c': 3, 'd': 4, 'e': 5})),
+        ('defaultdict', lambda: defaultdict(
+            list,
+            {'yellow': [1, 3], 'blue': [2, 4], 'red': [1]}
+        )),
+        ('ordered_dict', lambda: OrderedDict(
+            {'b': 40, 'c': 3, 'd': 4, 'e': 5}.items()
+        )),
+        ('user_dict', lambda: UserDict(
+            {'b': 40, 'c': 3, 'd': 4, 'e': 5}.items()
+        )),
+        ('user_string', lambda: UserString('testing')),
+    )
+
+    def test_integration_is_list_like_true(self):
+        for label, make in self.TRUE_CASES:
+            with self.subTest(label=label):
+                self.assertTrue(is_list_like(make()))
+
+    def test_integration_is_list_like_false(self):
+        for label, make in self.FALSE_CASES:
+            with self.subTest(label=label):
+                self.assertFalse(is_list_like(make()))
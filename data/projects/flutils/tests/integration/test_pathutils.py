@@ -1,15 +1,19 @@
 import os
 import shutil
+import tempfile
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
 
+# noinspection PyProtectedMember
 from flutils.pathutils import (
-    directory_present,
-    normalize_path,
+    _iter_glob,
+    chmod,
     path_absent,
 )
 
 # Structure
-# ~/tmp/flutils/
+# <tmp>/flutils/
 #  ├── 1/
 #  ├── 2/
 #  │   └── a.file
@@ -20,78 +24,179 @@ from flutils.pathutils import (
 #  └── 4/           (Not created)
 
 
-DIR_ROOT = normalize_path('~/tmp/flutils')
-DIR_1 = os.path.join(DIR_ROOT, '1')
-DIR_2 = os.path.join(DIR_ROOT, '2')
-DIR_3 = os.path.join(DIR_ROOT, '3')
-DIR_4 = os.path.join(DIR_ROOT, '4')
-
-FILE_A = os.path.join(DIR_2, 'a.file')
-FILE_B = os.path.join(DIR_3, 'b.file')
-
-LINK_2 = os.path.join(DIR_3, '2')
-LINK_A = os.path.join(DIR_3, 'a.file')
+def _paths(root: str) -> SimpleNamespace:
+    dir_2 = os.path.join(root, '2')
+    dir_3 = os.path.join(root, '3')
+    return SimpleNamespace(
+        root=root,
+        dir_1=os.path.join(root, '1'),
+        dir_2=dir_2,
+        dir_3=dir_3,
+        dir_4=os.path.join(root, '4'),
+        file_a=os.path.join(dir_2, 'a.file'),
+        file_b=os.path.join(dir_3, 'b.file'),
+        link_2=os.path.join(dir_3, '2'),
+        link_a=os.path.join(dir_3, 'a.file'),
+    )
+
+
+def _exists(path: str) -> bool:
+    # Unlike os.path.exists, this does not follow symlinks, so a
+    # dangling link still counts as present.
+    try:
+        os.lstat(path)
+    except OSError:
+        return False
+    return True
 
 
 class TestPathAbsent(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Build the layout once; each case gets a copy of it.  The
+        # links are relative so they still point inside the copy.
+        cls.template = tempfile.mkdtemp()
+        p = _paths(os.path.join(cls.template, 'flutils'))
+        os.makedirs(p.dir_1)
+        os.makedirs(p.dir_2)
+        os.makedirs(p.dir_3)
+
+        Path(p.file_a).touch()
+        Path(p.file_b).touch()
+
+        os.symlink(os.path.relpath(p.dir_2, p.dir_3), p.link_2)
+        os.symlink(os.path.relpath(p.file_a, p.dir_3), p.link_a)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.template, ignore_errors=True)
+
+    # (label, target, gone, present) where each path is named by its
+    # attribute on the namespace returned by _paths().
+    CASES = (
+        ('empty_dir', 'dir_1', ('dir_1',), ()),
+        ('file', 'file_b', ('file_b',), ()),
+        ('non_exists', 'dir_4', ('dir_4',), ()),
+        # Nothing below dir_3 can be left once dir_3 itself is gone.
+        ('dir', 'dir_3', ('dir_3',), ('dir_2', 'file_a')),
+        ('dir_link', 'link_2', ('link_2',), ('dir_2', 'file_b', 'file_a')),
+        ('parent_dir', 'root', ('dir_1', 'dir_2', 'dir_3', 'dir_4'), ()),
+    )
+
     def setUp(self) -> None:
-        if os.path.exists(DIR_ROOT):
-            shutil.rmtree(DIR_ROOT)
-        directory_present(DIR_1)
-        directory_present(DIR_2)
-        directory_present(DIR_3)
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _copy_tree(self, name: str) -> SimpleNamespace:
+        p = _paths(os.path.join(self.tmp, name))
+        shutil.copytree(
+            os.path.join(self.template, 'flutils'),
+            p.root,
+            symlinks=True
+        )
+        return p
 
-        with open(FILE_A, 'w') as f:
-            f.write('')
+    def test_path_absent(self) -> None:
+        for label, target, gone, present in self.CASES:
+            with self.subTest(label=label):
+                p = self._copy_tree(label)
+                path_absent(getattr(p, target))
+                for attr in gone:
+                    self.assertFalse(_exists(getattr(p, attr)), attr)
+                for attr in present:
+                    self.assertTrue(_exists(getattr(p, attr)), attr)
 
-        with open(FILE_B, 'w') as f:
-            f.write('')
 
-        os.symlink(DIR_2, LINK_2)
-        os.symlink(FILE_A, LINK_A)
+class TestIterGlob(unittest.TestCase):
 
-    def tearDown(self) -> None:
-        if os.path.exists(DIR_ROOT):
-            shutil.rmtree(DIR_ROOT)
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        os.makedirs(os.path.join(self.root, 'a', 'b'))
+        for name in ('a/one.txt', 'a/b/two.txt', 'a/b/three.py'):
+            Path(self.root, name).touch()
+
+    def _glob(self, pattern: str):
+        pattern = os.path.join(self.root, pattern)
+        return sorted(
+            (os.path.relpath(path, self.root), is_dir, is_file)
+            for path, is_dir, is_file in _iter_glob(pattern)
+        )
 
-    def test_delete_empty_dir(self) -> None:
-        path_absent(DIR_1)
-        self.assertFalse(
-            os.path.exists(DIR_1)
+    def test_star(self) -> None:
+        self.assertEqual(
+            self._glob('a/*'),
+            [('a/b', True, False), ('a/one.txt', False, True)]
         )
 
-    def test_delete_file(self) -> None:
-        path_absent(FILE_B)
-        self.assertFalse(
-            os.path.exists(FILE_B)
+    def test_recursive(self) -> None:
+        self.assertEqual(
+            self._glob('**/*.txt'),
+            [('a/b/two.txt', False, True), ('a/one.txt', False, True)]
         )
 
-    def test_non_exists(self) -> None:
-        path_absent(DIR_4)
-        self.assertFalse(
-            os.path.exists(DIR_4)
+    def test_trailing_recursive(self) -> None:
+        self.assertEqual(
+            self._glob('a/b/**'),
+            [
+                ('a/b', True, False),
+                ('a/b/three.py', False, True),
+                ('a/b/two.txt', False, True),
+            ]
         )
 
-    def test_delete_dir(self) -> None:
-        path_absent(DIR_3)
-        self.assertFalse(os.path.exists(DIR_3))
-        self.assertFalse(os.path.exists(FILE_B))
-        self.assertFalse(os.path.exists(LINK_2))
-        self.assertFalse(os.path.exists(LINK_A))
-        self.assertTrue(os.path.exists(DIR_2))
-        self.assertTrue(os.path.exists(FILE_A))
-
-    def test_delete_dir_link(self) -> None:
-        path_absent(LINK_2)
-        self.assertFalse(os.path.exists(LINK_2))
-        self.assertTrue(os.path.exists(DIR_2))
-        self.assertTrue(os.path.exists(FILE_B))
-        self.assertTrue(os.path.exists(FILE_A))
-
-    def test_delete_parent_dir(self) -> None:
-        path_absent(DIR_ROOT)
-        self.assertFalse(os.path.exists(DIR_1))
-        self.assertFalse(os.path.exists(DIR_2))
-        self.assertFalse(os.path.exists(DIR_3))
-        self.assertFalse(os.path.exists(DIR_4))
+    def test_no_match(self) -> None:
+        self.assertEqual(self._glob('c/*'), [])
+
+    def test_trailing_recursive_missing(self) -> None:
+        self.assertEqual(self._glob('c/**'), [])
+
+    def test_trailing_recursive_file(self) -> None:
+        self.assertEqual(self._glob('a/one.txt/**'), [])
+
+
+class TestChmodGlob(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        for name in ('two.txt', 'three.py'):
+            Path(self.root, name).touch()
+            os.chmod(os.path.join(self.root, name), 0o644)
+
+    def _mode(self, name: str) -> int:
+        return os.stat(os.path.join(self.root, name)).st_mode & 0o777
+
+    def test_question_mark(self) -> None:
+        chmod(os.path.join(self.root, 't??.*'), mode_file=0o600)
+        self.assertEqual(self._mode('two.txt'), 0o600)
+        self.assertEqual(self._mode('three.py'), 0o644)
+
+    def test_character_set(self) -> None:
+        chmod(os.path.join(self.root, '[t]hree.py'), mode_file=0o600)
+        self.assertEqual(self._mode('two.txt'), 0o644)
+        self.assertEqual(self._mode('three.py'), 0o600)
+
+    def test_literal_bracket(self) -> None:
+        # A '[' is glob magic, so a literal one must be escaped as '[[]'.
+        Path(self.root, 'a[b].txt').touch()
+        os.chmod(os.path.join(self.root, 'a[b].txt'), 0o644)
+        chmod(os.path.join(self.root, 'a[b].txt'), mode_file=0o600)
+        self.assertEqual(self._mode('a[b].txt'), 0o644)
+        chmod(os.path.join(self.root, 'a[[]b].txt'), mode_file=0o600)
+        self.assertEqual(self._mode('a[b].txt'), 0o600)
+
+    def test_trailing_recursive_missing(self) -> None:
+        chmod(os.path.join(self.root, 'missing', '**'), mode_dir=0o700)
+        self.assertFalse(os.path.exists(os.path.join(self.root, 'missing')))
+
+    def test_trailing_recursive_file(self) -> None:
+        chmod(
+            os.path.join(self.root, 'two.txt', '**'),
+            mode_file=0o600,
+            mode_dir=0o700
+        )
+        self.assertEqual(self._mode('two.txt'), 0o644)
@@ -1,6 +1,6 @@
 import unittest
 from typing import (
-    List,
+    Callable,
     NamedTuple,
     Optional,
 )
@@ -21,120 +21,164 @@ class Values(NamedTuple):
     exp: str
 
 
-def _add_values(
-        arg: str,
-        exp: str,
-        values: List[Values],
-        lower_first: Optional[bool] = None
-) -> None:
-    values.append(Values(arg, lower_first, exp))
+class _LazyMsg:
+    """Build an assertion message only when unittest formats it."""
+
+    def __init__(self, func: Callable[[], str]) -> None:
+        self.func = func
+
+    def __str__(self) -> str:
+        return self.func()
 
 
 class TestStrutils(unittest.TestCase):
 
+    CAMEL_CASES = (
+        Values('FooBar', None, 'foo_bar'),
+        Values('oneTwo', None, 'one_two'),
+        Values('THREEFourFive', None, 'three_four_five'),
+        Values('sixSEVENEight', None, 'six_seven_eight'),
+        Values('nine9Ten', None, 'nine9_ten'),
+        Values('E', None, 'e'),
+        Values('\u00c9t\u00e9Foo', None, '\u00e9t\u00e9_foo'),
+    )
+
+    UNDERSCORE_CASES = (
+        Values('foo_bar', True, 'fooBar'),
+        Values('one__two', False, 'OneTwo'),
+        Values('three__four__', True, 'threeFour'),
+        Values('__five_six__', False, 'FiveSix'),
+        Values('seven8nine_ten', True, 'seven8nineTen'),
+        Values("it's_FOO", False, "It'sFoo"),
+    )
+
+    UNICODE_LITERAL_CASES = (
+        Values(
+            '1.\u2605 \U0001f6d1',
+            None,
+            '\\x31\\x2e\\u2605\\x20\\U0001f6d1'
+        ),
+        Values('', None, ''),
+        Values('a 1\x00\x7f', None, '\\x61\\x20\\x31\\x00\\x7f'),
+        Values('a\n\xff', None, '\\x61\\x0a\\xff'),
+        Values('\u0100\uffff', None, '\\u0100\\uffff'),
+        Values('\U00010000a', None, '\\U00010000\\x61'),
+    )
+
+    UTF8_LITERAL_CASES = (
+        Values(
+            '1.\u2605 \U0001f6d1',
+            None,
+            '\\x31\\x2e\\xe2\\x98\\x85\\x20\\xf0\\x9f\\x9b\\x91'
+        ),
+        Values('', None, ''),
+        # Bytes below 0x10 are zero padded to two hex digits.
+        Values('\n', None, '\\x0a'),
+        Values('\x00\x0f', None, '\\x00\\x0f'),
+        Values('a\n', None, '\\x61\\x0a'),
+        Values('\xff', None, '\\xc3\\xbf'),
+        Values('\U00010000', None, '\\xf0\\x90\\x80\\x80'),
+    )
+
+    CONVERT_UNICODE_CASES = (
+        Values(
+            '\\x31\\x2e\\u2605\\x20\\U0001f6d1',
+            None,
+            '1.\u2605 \U0001f6d1'
+        ),
+    )
+
+    CONVERT_UTF8_CASES = (
+        Values('hello\\xe2\\x98\\x85', None, 'hello\u2605'),  # hello★
+    )
+
     def test_camel_to_underscore(self) -> None:
-        values: List[Values] = []
-        _add_values('FooBar', 'foo_bar', values)
-        _add_values('oneTwo', 'one_two', values)
-        _add_values('THREEFourFive', 'three_four_five', values)
-        _add_values('sixSEVENEight', 'six_seven_eight', values)
-        for v in values:
+        for v in self.CAMEL_CASES:
             with self.subTest(v=v):
                 ret = camel_to_underscore(v.arg)
                 self.assertEqual(
                     ret,
                     v.exp,
-                    msg=(
+                    msg=_LazyMsg(lambda: (
                         f'\n\n'
                         f'camel_to_underscore({v.arg!r})\n'
                         f'expected: {v.exp!r}\n'
                         f'     got: {ret!r}\n'
-                    )
+                    ))
                 )
 
     def test_underscore_to_camel(self) -> None:
-        values: List[Values] = []
-        _add_values('foo_bar', 'fooBar', values, lower_first=True)
-        _add_values('one__two', 'OneTwo', values, lower_first=False)
-        _add_values('three__four__', 'threeFour', values, lower_first=True)
-        _add_values('__five_six__', 'FiveSix', values, lower_first=False)
-        for v in values:
+        for v in self.UNDERSCORE_CASES:
             with self.subTest(v=v):
                 ret = underscore_to_camel(v.arg, lower_first=v.lower_first)
                 self.assertEqual(
                     ret,
                     v.exp,
-                    msg=(
+                    msg=_LazyMsg(lambda: (
                         f'\n\n'
                         f'underscore_to_camel({v.arg!r}, '
                         f'lower_first={v.lower_first!r})\n'
                         f'expected: {v.exp!r}\n'
                         f'     got: {ret!r}\n'
-                    )
+                    ))
                 )
 
     def test_as_escaped_unicode_literal(self) -> None:
-        arg = '1.\u2605 \U0001f6d1'
-        arg_lit = "'1.\\u2605 \\U0001f6d1'"
-        ret = as_escaped_unicode_literal(arg)
-        exp = '\\x31\\x2e\\u2605\\x20\\U0001f6d1'
-        self.assertEqual(
-            ret,
-            exp,
-            msg=(
-                f'\n\n'
-                f'as_escaped_unicode_literal({arg_lit})\n'
-                f'expected: {exp!r}\n'
-                f'     got: {ret!r}\n'
-            )
-        )
+        for v in self.UNICODE_LITERAL_CASES:
+            with self.subTest(v=v):
+                ret = as_escaped_unicode_literal(v.arg)
+                self.assertEqual(
+                    ret,
+                    v.exp,
+                    msg=_LazyMsg(lambda: (
+                        f'\n\n'
+                        f'as_escaped_unicode_literal({v.arg!r})\n'
+                        f'expected: {v.exp!r}\n'
+                        f'     got: {ret!r}\n'
+                    ))
+                )
 
     def test_as_escaped_utf8_literal(self) -> None:
-        arg = '1.\u2605 \U0001f6d1'
-        arg_lit = "'1.\\u2605 \\U0001f6d1'"
-        ret = as_escaped_utf8_literal(arg)
-        exp = '\\x31\\x2e\\xe2\\x98\\x85\\x20\\xf0\\x9f\\x9b\\x91'
-        self.assertEqual(
-            ret,
-            exp,
-            msg=(
-                f'\n\n'
-                f'as_escaped_utf8_literal({arg_lit})\n'
-                f'expected: {exp!r}\n'
-                f'     got: {ret!r}\n'
-            )
-        )
+        for v in self.UTF8_LITERAL_CASES:
+            with self.subTest(v=v):
+                ret = as_escaped_utf8_literal(v.arg)
+                self.assertEqual(
+                    ret,
+                    v.exp,
+                    msg=_LazyMsg(lambda: (
+                        f'\n\n'
+                        f'as_escaped_utf8_literal({v.arg!r})\n'
+                        f'expected: {v.exp!r}\n'
+                        f'     got: {ret!r}\n'
+                    ))
+                )
 
     def test_convert_escaped_unicode_literal(self) -> None:
-        exp = '\x31\x2e\u2605\x20\U0001f6d1'
-        arg = '\\x31\\x2e\\u2605\\x20\\U0001f6d1'
-        ret = convert_escaped_unicode_literal(arg)
-        self.assertEqual(
-            ret,
-            exp,
-            msg=(
-                f'\n\n'
-                f'convert_escaped_unicode_literal({arg!r})\n'
-                f'expected: {exp!r}\n'
-                f'     got: {ret!r}\n'
-            )
-        )
+        for v in self.CONVERT_UNICODE_CASES:
+            with self.subTest(v=v):
+                ret = convert_escaped_unicode_literal(v.arg)
+                self.assertEqual(
+                    ret,
+                    v.exp,
+                    msg=_LazyMsg(lambda: (
+                        f'\n\n'
+                        f'convert_escaped_unicode_literal({v.arg!r})\n'
+                        f'expected: {v.exp!r}\n'
+                        f'     got: {ret!r}\n'
+                    ))
+                )
 
     def test_convert_escaped_utf8_literal(self) -> None:
-        values = (
-            ('hello\\xe2\\x98\\x85', 'hello\u2605'),  # hello★
-
-        )
-        for arg, exp in values:
-            with self.subTest(arg=arg, exp=exp):
-                ret = convert_escaped_utf8_literal(arg)
+        for v in self.CONVERT_UTF8_CASES:
+            with self.subTest(v=v):
+                ret = convert_escaped_utf8_literal(v.arg)
                 self.assertEqual(
                     ret,
-                    exp,
-                    msg=(
+                    v.exp,
+                    msg=_LazyMsg(lambda: (
                         f'\n\n'
-                        f'convert_escaped_utf8_literal({arg})\n'
-                        f'expected: {exp!r}\n'
+                        f'convert_escaped_utf8_literal({v.arg!r})\n'
+                        f'expected: {v.exp!r}\n'
                         f'     got: {ret!r}\n'
-                    )
+                    ))
                 )
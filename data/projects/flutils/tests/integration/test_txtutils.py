@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 # noinspection PyProtectedMember
 from flutils.txtutils import (
@@ -33,6 +34,16 @@ class TestTextUtilsLenWithoutAnsi(unittest.TestCase):
         res = len_without_ansi(chunks)
         self.assertEqual(res, 7)
 
+    def test_string_with_non_sgr_ansi(self) -> None:
+        # Only the '\x1b[...m' codes are not counted.
+        chunks = '\x1b[2Jfoo\x1b[0m'
+        res = len_without_ansi(chunks)
+        self.assertEqual(res, 7)
+
+    def test_empty(self) -> None:
+        self.assertEqual(len_without_ansi(''), 0)
+        self.assertEqual(len_without_ansi([]), 0)
+
 
 class TestTextUtilsAnsiTextWrapper(unittest.TestCase):
 
@@ -84,6 +95,15 @@ class TestTextUtilsAnsiTextWrapper(unittest.TestCase):
         obj.initial_indent = 'foo: '
         self.assertEqual(obj.initial_indent_len, 5)
 
+    def test_initial_indent_attribute_unchanged(self) -> None:
+        obj = AnsiTextWrapper(initial_indent='\x1b[31mfoo: bar\x1b[0m')
+        with patch('flutils.txtutils.len_without_ansi') as len_without_ansi_:
+            obj.initial_indent = '\x1b[31mfoo: bar\x1b[0m'
+            obj.subsequent_indent = ''
+            obj.placeholder = ' [...]'
+        len_without_ansi_.assert_not_called()
+        self.assertEqual(obj.initial_indent_len, 8)
+
     def test_initial_indent_empty(self) -> None:
         obj = AnsiTextWrapper()
         self.assertEqual(obj.initial_indent_len, 0)
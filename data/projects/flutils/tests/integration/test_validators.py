@@ -85,7 +85,7 @@ class TestValidateIdentifier(unittest.TestCase):
             '6foo'
         )
         for val in vals:
-            with self.assertRaises(SyntaxError):
+            with self.assertRaisesRegex(SyntaxError, 'start with a number'):
                 validate_identifier(val)
 
     def test_integration_validate_identifier_invalid_raises(self):
@@ -98,5 +98,24 @@ class TestValidateIdentifier(unittest.TestCase):
             'j*k'
         )
         for val in vals:
-            with self.assertRaises(SyntaxError):
+            with self.assertRaisesRegex(SyntaxError, 'is invalid'):
                 validate_identifier(val)
+
+    def test_integration_validate_identifier_repeated_raises(self):
+        errors = []
+        for _ in range(2):
+            with self.assertRaisesRegex(SyntaxError, 'is invalid') as cm:
+                validate_identifier('l-m')
+            errors.append(cm.exception)
+        self.assertIsNot(errors[0], errors[1])
+
+    def test_integration_validate_identifier_underscore_falsy(self):
+        try:
+            validate_identifier('_foo', allow_underscore=0)
+        except SyntaxError as e:
+            self.fail(
+                "'validate_identifier()' raised SyntaxError unexpectedly! %s"
+                % e
+            )
+        with self.assertRaises(SyntaxError):
+            validate_identifier('_foo', allow_underscore=False)
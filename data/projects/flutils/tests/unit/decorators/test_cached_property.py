@@ -1,14 +1,6 @@
-import keyword
-import types
 import unittest
 from functools import wraps
-from importlib.machinery import ModuleSpec
-from unittest.mock import (
-    MagicMock,
-    call,
-    patch,
-    sentinel,
-)
+from unittest.mock import patch
 
 from flutils.decorators import cached_property
 
@@ -1,10 +1,6 @@
-import keyword
-import types
 import unittest
 from importlib.machinery import ModuleSpec
 from unittest.mock import (
-    MagicMock,
-    call,
     patch,
     sentinel,
 )
@@ -1,12 +1,5 @@
-import keyword
-import types
 import unittest
-from importlib.machinery import ModuleSpec
-from unittest.mock import (
-    MagicMock,
-    call,
-    patch,
-)
+from unittest.mock import patch
 
 from flutils.moduleutils import _CherryPickFinder
 
@@ -1,4 +1,3 @@
-import keyword
 import types
 import unittest
 from unittest.mock import (
@@ -1,12 +1,8 @@
-import keyword
 import types
 import unittest
-from importlib.machinery import ModuleSpec
 from unittest.mock import (
     MagicMock,
-    call,
     patch,
-    sentinel,
 )
 
 from flutils.moduleutils import lazy_import_module
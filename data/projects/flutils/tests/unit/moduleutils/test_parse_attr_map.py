@@ -1,4 +1,3 @@
-import keyword
 import unittest
 from unittest.mock import patch
 
@@ -1,9 +1,5 @@
-import keyword
 import unittest
-from unittest.mock import (
-    Mock,
-    patch,
-)
+from unittest.mock import patch
 
 from flutils.moduleutils import _validate_attr_identifier
 
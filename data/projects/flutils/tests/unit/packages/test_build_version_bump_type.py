@@ -6,32 +6,33 @@ from typing import (
 
 # noinspection PyProtectedMember
 from flutils.packages import (
-    _BUMP_VERSION_MAJOR,
-    _BUMP_VERSION_MINOR,
-    _BUMP_VERSION_MINOR_ALPHA,
-    _BUMP_VERSION_MINOR_BETA,
-    _BUMP_VERSION_PATCH,
-    _BUMP_VERSION_PATCH_ALPHA,
-    _BUMP_VERSION_PATCH_BETA,
+    _BumpHandler,
     _build_version_bump_type,
+    _bump_major,
+    _bump_minor,
+    _bump_minor_alpha,
+    _bump_minor_beta,
+    _bump_patch,
+    _bump_patch_alpha,
+    _bump_patch_beta,
 )
 
 
 class TestBuildVersionBumpType(unittest.TestCase):
 
     def test_build_version_bump_type__1(self) -> None:
-        values: List[Tuple[Tuple[int, str], int]] = [
-            ((0, ''), _BUMP_VERSION_MAJOR),
-            ((1, None), _BUMP_VERSION_MINOR),
-            ((2, ''), _BUMP_VERSION_PATCH),
-            ((1, 'a'), _BUMP_VERSION_MINOR_ALPHA),
-            ((1, 'alpha'), _BUMP_VERSION_MINOR_ALPHA),
-            ((1, 'b'), _BUMP_VERSION_MINOR_BETA),
-            ((1, 'beta'), _BUMP_VERSION_MINOR_BETA),
-            ((2, 'a'), _BUMP_VERSION_PATCH_ALPHA),
-            ((2, 'alpha'), _BUMP_VERSION_PATCH_ALPHA),
-            ((2, 'b'), _BUMP_VERSION_PATCH_BETA),
-            ((2, 'beta'), _BUMP_VERSION_PATCH_BETA),
+        values: List[Tuple[Tuple[int, str], _BumpHandler]] = [
+            ((0, ''), _bump_major),
+            ((1, None), _bump_minor),
+            ((2, ''), _bump_patch),
+            ((1, 'a'), _bump_minor_alpha),
+            ((1, 'alpha'), _bump_minor_alpha),
+            ((1, 'b'), _bump_minor_beta),
+            ((1, 'beta'), _bump_minor_beta),
+            ((2, 'a'), _bump_patch_alpha),
+            ((2, 'alpha'), _bump_patch_alpha),
+            ((2, 'b'), _bump_patch_beta),
+            ((2, 'beta'), _bump_patch_beta),
         ]
         for args, exp in values:
             kwargs = {
@@ -16,6 +16,10 @@ from flutils.packages import (
 
 class TestBuildVersionInfo(unittest.TestCase):
 
+    def setUp(self) -> None:
+        _build_version_info.cache_clear()
+        self.addCleanup(_build_version_info.cache_clear)
+
     def test_build_version_info__1(self) -> None:
         arg = '1.2.3'
         exp = _VersionInfo(
@@ -205,3 +209,30 @@ class TestBuildVersionInfo(unittest.TestCase):
             with self.subTest(arg=arg):
                 with self.assertRaises(ValueError):
                     _build_version_info(arg)
+
+    def test_build_version_info__5(self) -> None:
+        arg = '1.2.3'
+        patcher = patch(
+            'flutils.packages.StrictVersion',
+            autospec=True,
+            return_value=Mock(spec=StrictVersion)
+        )
+        strict_version = patcher.start()
+        self.addCleanup(patcher.stop)
+        part = _VersionPart(
+            pos=0,
+            txt='1',
+            num=1,
+            pre_txt='',
+            pre_num=-1,
+            name='major'
+        )
+        patcher = patch(
+            'flutils.packages._each_version_part',
+            return_value=[part, part, part]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        ret = _build_version_info(arg)
+        self.assertIs(_build_version_info(arg), ret)
+        strict_version.assert_called_once_with(arg)
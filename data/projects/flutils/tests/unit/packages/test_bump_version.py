@@ -3,15 +3,15 @@ from unittest.mock import patch
 
 # noinspection PyProtectedMember
 from flutils.packages import (
-    _BUMP_VERSION_MAJOR,
-    _BUMP_VERSION_MINOR,
-    _BUMP_VERSION_MINOR_ALPHA,
-    _BUMP_VERSION_MINOR_BETA,
-    _BUMP_VERSION_PATCH,
-    _BUMP_VERSION_PATCH_ALPHA,
-    _BUMP_VERSION_PATCH_BETA,
     _VersionInfo,
     _VersionPart,
+    _bump_major,
+    _bump_minor,
+    _bump_minor_alpha,
+    _bump_minor_beta,
+    _bump_patch,
+    _bump_patch_alpha,
+    _bump_patch_beta,
     bump_version,
 )
 
@@ -22,7 +22,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2.3'
         position = 1
         pre_release = ''
-        bump_type = _BUMP_VERSION_MAJOR
+        bump_type = _bump_major
         exp = '2.0'
         ver_info = _VersionInfo(
             version=version,
@@ -101,7 +101,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2.3'
         position = 2
         pre_release = ''
-        bump_type = _BUMP_VERSION_MINOR
+        bump_type = _bump_minor
         exp = '1.3'
         ver_info = _VersionInfo(
             version=version,
@@ -180,7 +180,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2a19'
         position = 2
         pre_release = ''
-        bump_type = _BUMP_VERSION_MINOR
+        bump_type = _bump_minor
         exp = '1.2'
         ver_info = _VersionInfo(
             version=version,
@@ -259,7 +259,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2.3'
         position = 2
         pre_release = 'a'
-        bump_type = _BUMP_VERSION_MINOR_ALPHA
+        bump_type = _bump_minor_alpha
         exp = '1.3a0'
         ver_info = _VersionInfo(
             version=version,
@@ -338,7 +338,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2a0'
         position = 2
         pre_release = 'a'
-        bump_type = _BUMP_VERSION_MINOR_ALPHA
+        bump_type = _bump_minor_alpha
         exp = '1.2a1'
         ver_info = _VersionInfo(
             version=version,
@@ -417,7 +417,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2b0'
         position = 2
         pre_release = 'a'
-        bump_type = _BUMP_VERSION_MINOR_ALPHA
+        bump_type = _bump_minor_alpha
         exp = '1.3a0'
         ver_info = _VersionInfo(
             version=version,
@@ -496,7 +496,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2b0'
         position = 2
         pre_release = 'b'
-        bump_type = _BUMP_VERSION_MINOR_BETA
+        bump_type = _bump_minor_beta
         exp = '1.2b1'
         ver_info = _VersionInfo(
             version=version,
@@ -575,7 +575,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2a0'
         position = 2
         pre_release = 'b'
-        bump_type = _BUMP_VERSION_MINOR_BETA
+        bump_type = _bump_minor_beta
         exp = '1.2b0'
         ver_info = _VersionInfo(
             version=version,
@@ -654,7 +654,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2'
         position = 2
         pre_release = 'b'
-        bump_type = _BUMP_VERSION_MINOR_BETA
+        bump_type = _bump_minor_beta
         exp = '1.3b0'
         ver_info = _VersionInfo(
             version=version,
@@ -733,7 +733,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2.3'
         position = 3
         pre_release = ''
-        bump_type = _BUMP_VERSION_PATCH
+        bump_type = _bump_patch
         exp = '1.2.4'
         ver_info = _VersionInfo(
             version=version,
@@ -812,7 +812,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.140.2b20'
         position = 3
         pre_release = None
-        bump_type = _BUMP_VERSION_PATCH
+        bump_type = _bump_patch
         exp = '1.140.2'
         ver_info = _VersionInfo(
             version=version,
@@ -891,7 +891,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.140'
         position = 3
         pre_release = None
-        bump_type = _BUMP_VERSION_PATCH
+        bump_type = _bump_patch
         exp = '1.140.1'
         ver_info = _VersionInfo(
             version=version,
@@ -970,7 +970,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2.3'
         position = 3
         pre_release = 'a'
-        bump_type = _BUMP_VERSION_PATCH_ALPHA
+        bump_type = _bump_patch_alpha
         exp = '1.2.4a0'
         ver_info = _VersionInfo(
             version=version,
@@ -1049,7 +1049,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2.1b10'
         position = 3
         pre_release = 'a'
-        bump_type = _BUMP_VERSION_PATCH_ALPHA
+        bump_type = _bump_patch_alpha
         exp = '1.2.2a0'
         ver_info = _VersionInfo(
             version=version,
@@ -1128,7 +1128,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2.1a137'
         position = 3
         pre_release = 'a'
-        bump_type = _BUMP_VERSION_PATCH_ALPHA
+        bump_type = _bump_patch_alpha
         exp = '1.2.1a138'
         ver_info = _VersionInfo(
             version=version,
@@ -1207,7 +1207,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2.1a137'
         position = 3
         pre_release = 'beta'
-        bump_type = _BUMP_VERSION_PATCH_BETA
+        bump_type = _bump_patch_beta
         exp = '1.2.1b0'
         ver_info = _VersionInfo(
             version=version,
@@ -1286,7 +1286,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '1.2.1b137'
         position = 3
         pre_release = 'beta'
-        bump_type = _BUMP_VERSION_PATCH_BETA
+        bump_type = _bump_patch_beta
         exp = '1.2.1b138'
         ver_info = _VersionInfo(
             version=version,
@@ -1365,7 +1365,7 @@ class TestBumpVersion(unittest.TestCase):
         version = '7.6.14'
         position = 3
         pre_release = 'beta'
-        bump_type = _BUMP_VERSION_PATCH_BETA
+        bump_type = _bump_patch_beta
         exp = '7.6.15b0'
         ver_info = _VersionInfo(
             version=version,
@@ -1,4 +1,6 @@
+import stat
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from flutils.pathutils import chmod
@@ -24,15 +26,39 @@ class TestChmodFile(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # Mock os.stat and os.chmod
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            return_value=SimpleNamespace(st_mode=stat.S_IFREG | 0o644)
+        )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch(
+            'flutils.pathutils.os.chmod',
+            return_value=None
+        )
+        self.os_chmod = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_chmod_file_default(self):
         chmod('~/tmp/test.txt')
         self.normalize_path.assert_called_with('~/tmp/test.txt')
-        self.path.chmod.assert_called_with(0o600)
+        self.os_stat.assert_called_once_with(self.path.as_posix())
+        self.os_chmod.assert_called_once_with(self.path.as_posix(), 0o600)
 
     def test_chmod_file_mode(self):
         chmod('~/tmp/test.txt', mode_file=0o777)
         self.normalize_path.assert_called_with('~/tmp/test.txt')
-        self.path.chmod.assert_called_with(0o777)
+        self.os_stat.assert_called_once_with(self.path.as_posix())
+        self.os_chmod.assert_called_once_with(self.path.as_posix(), 0o777)
+
+    def test_chmod_file_missing(self):
+        self.os_stat.side_effect = FileNotFoundError(
+            2, 'No such file or directory'
+        )
+        chmod('~/tmp/test.txt')
+        self.os_chmod.assert_not_called()
 
 
 class TestChmodDirectory(unittest.TestCase):
@@ -53,15 +79,32 @@ class TestChmodDirectory(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # Mock os.stat and os.chmod
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            return_value=SimpleNamespace(st_mode=stat.S_IFDIR | 0o644)
+        )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch(
+            'flutils.pathutils.os.chmod',
+            return_value=None
+        )
+        self.os_chmod = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_chmod_directory_default(self):
         chmod('~/tmp/test')
         self.normalize_path.assert_called_with('~/tmp/test')
-        self.path.chmod.assert_called_with(0o700)
+        self.os_stat.assert_called_once_with(self.path.as_posix())
+        self.os_chmod.assert_called_once_with(self.path.as_posix(), 0o700)
 
     def test_chmod_directory_mode(self):
         chmod('~/tmp/test', mode_dir=0o770)
         self.normalize_path.assert_called_with('~/tmp/test')
-        self.path.chmod.assert_called_with(0o770)
+        self.os_stat.assert_called_once_with(self.path.as_posix())
+        self.os_chmod.assert_called_once_with(self.path.as_posix(), 0o770)
 
 
 class TestChmodGlob(unittest.TestCase):
@@ -125,51 +168,83 @@ class TestChmodGlob(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # Mock the pathlib.Path() return value
+        # Mock the flutils.pathutils._iter_glob() return value
         patcher = patch(
-            'flutils.pathutils.Path',
-            return_value=self.path
+            'flutils.pathutils._iter_glob',
+            return_value=[
+                (
+                    path.as_posix(),
+                    path.kwargs.get('is_dir', False),
+                    path.kwargs.get('is_file', False),
+                )
+                for path in self.path.glob_data
+            ]
+        )
+        self.iter_glob = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Mock os.chmod
+        patcher = patch(
+            'flutils.pathutils.os.chmod',
+            return_value=None
+        )
+        self.os_chmod = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Mock os.stat for the parent directory
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            return_value=SimpleNamespace(st_mode=stat.S_IFDIR | 0o755)
         )
-        self.path_func = patcher.start()
+        self.os_stat = patcher.start()
         self.addCleanup(patcher.stop)
 
     def test_chmod_glob_default(self):
         chmod('~/**')
         self.normalize_path.assert_called_with('~/**')
-        self.path.glob.assert_called_with('/home/test_user/**')
+        self.iter_glob.assert_called_with('/home/test_user/**')
         for path in self.path.glob_data:
             if path.kwargs.get('is_file', False) is True:
-                path.chmod.assert_called_with(0o600)
+                self.os_chmod.assert_any_call(path.as_posix(), 0o600)
             elif path.kwargs.get('is_dir', False) is True:
-                path.chmod.assert_called_with(0o700)
+                self.os_chmod.assert_any_call(path.as_posix(), 0o700)
             elif path.kwargs.get('is_fifo', False) is True:
-                path.chmod.assert_not_called()
+                self.assertNotIn(
+                    path.as_posix(),
+                    [args[0] for args, _ in self.os_chmod.call_args_list]
+                )
 
     def test_chmod_glob_modes(self):
         chmod('~/**', mode_file=0o660, mode_dir=0o770)
         self.normalize_path.assert_called_with('~/**')
-        self.path.glob.assert_called_with('/home/test_user/**')
+        self.iter_glob.assert_called_with('/home/test_user/**')
         for path in self.path.glob_data:
             if path.kwargs.get('is_file', False) is True:
-                path.chmod.assert_called_with(0o660)
+                self.os_chmod.assert_any_call(path.as_posix(), 0o660)
             elif path.kwargs.get('is_dir', False) is True:
-                path.chmod.assert_called_with(0o770)
+                self.os_chmod.assert_any_call(path.as_posix(), 0o770)
             elif path.kwargs.get('is_fifo', False) is True:
-                path.chmod.assert_not_called()
+                self.assertNotIn(
+                    path.as_posix(),
+                    [args[0] for args, _ in self.os_chmod.call_args_list]
+                )
 
     def test_chmod_glob_include_parent(self):
         chmod('~/**', mode_file=0o660, mode_dir=0o770, include_parent=True)
         self.normalize_path.assert_called_with('~/**')
-        self.path.glob.assert_called_with('/home/test_user/**')
+        self.iter_glob.assert_called_with('/home/test_user/**')
         for path in self.path.glob_data:
             if path.kwargs.get('is_file', False) is True:
-                path.chmod.assert_called_with(0o660)
+                self.os_chmod.assert_any_call(path.as_posix(), 0o660)
             elif path.kwargs.get('is_dir', False) is True:
-                path.chmod.assert_called_with(0o770)
+                self.os_chmod.assert_any_call(path.as_posix(), 0o770)
             elif path.kwargs.get('is_fifo', False) is True:
-                path.chmod.assert_not_called()
-        self.path.parent.is_dir.assert_called()
-        self.path.parent.chmod.assert_called_with(0o770)
+                self.assertNotIn(
+                    path.as_posix(),
+                    [args[0] for args, _ in self.os_chmod.call_args_list]
+                )
+        self.os_stat.assert_called_once_with(self.path.parent.as_posix())
+        self.os_chmod.assert_any_call(self.path.parent.as_posix(), 0o770)
 
 
 class TestChmodEmptyGlob(unittest.TestCase):
@@ -188,16 +263,31 @@ class TestChmodEmptyGlob(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # Mock the pathlib.Path() return value
+        # Mock the flutils.pathutils._iter_glob() return value
         patcher = patch(
-            'flutils.pathutils.Path',
-            return_value=self.path
+            'flutils.pathutils._iter_glob',
+            return_value=[
+                (
+                    path.as_posix(),
+                    path.kwargs.get('is_dir', False),
+                    path.kwargs.get('is_file', False),
+                )
+                for path in self.path.glob_data
+            ]
+        )
+        self.iter_glob = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch(
+            'flutils.pathutils.os.chmod',
+            return_value=None
         )
-        self.path_func = patcher.start()
+        self.os_chmod = patcher.start()
         self.addCleanup(patcher.stop)
 
     def test_chmod_empty_glob(self):
         chmod('~/**', mode_file=0o660, mode_dir=0o770, include_parent=True)
         self.normalize_path.assert_called_with('~/**')
-        self.path.glob.assert_called_with('/home/test_user/**')
+        self.iter_glob.assert_called_with('/home/test_user/**')
         self.path.parent.chmod.assert_not_called()
+        self.os_chmod.assert_not_called()
@@ -62,6 +62,13 @@ class TestChown(unittest.TestCase):
         self.get_os_group.assert_not_called()
         self.os_chown.assert_called_with(self.path.as_posix(), -1, -1)
 
+    def test_chown_current_group(self):
+        chown('~/tmp/test.txt', group='-1')
+        self.normalize_path.assert_called_with('~/tmp/test.txt')
+        self.get_os_user.assert_called_with(None)
+        self.get_os_group.assert_not_called()
+        self.os_chown.assert_called_with(self.path.as_posix(), 9753, -1)
+
     def test_chown_user_group(self):
         chown('~/tmp/test.txt', user='test_user', group='test_group')
         self.normalize_path.assert_called_with('~/tmp/test.txt')
@@ -130,12 +137,19 @@ class TestChownGlob(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # Mock the pathlib.Path() return value
+        # Mock the flutils.pathutils._iter_glob() return value
         patcher = patch(
-            'flutils.pathutils.Path',
-            return_value=self.path
+            'flutils.pathutils._iter_glob',
+            return_value=[
+                (
+                    path.as_posix(),
+                    path.kwargs.get('is_dir', False),
+                    path.kwargs.get('is_file', False),
+                )
+                for path in self.path.glob_data
+            ]
         )
-        self.path_func = patcher.start()
+        self.iter_glob = patcher.start()
         self.addCleanup(patcher.stop)
 
         # Mock the flutils.pathutils.get_os_user() return value
@@ -165,20 +179,19 @@ class TestChownGlob(unittest.TestCase):
     def test_chown_glob(self):
         chown('~/**')
         self.normalize_path.assert_called_with('~/**')
+        self.iter_glob.assert_called_with('/home/test_user/**')
         self.get_os_user.assert_called_with(None)
         self.get_os_group.assert_called_with(None)
         for path in self.path.glob_data:
             if path.kwargs.get('is_dir', False) is True:
                 self.os_chown.assert_any_call(path.as_posix(), 9753, 1357)
-                path.is_dir.assert_called()
-                path.is_file.assert_not_called()
             elif path.kwargs.get('is_file', False) is True:
                 self.os_chown.assert_any_call(path.as_posix(), 9753, 1357)
-                path.is_dir.assert_called()
-                path.is_file.assert_called()
             else:
-                path.is_dir.assert_called()
-                path.is_file.assert_called()
+                self.assertNotIn(
+                    path.as_posix(),
+                    [args[0] for args, _ in self.os_chown.call_args_list]
+                )
 
     def test_chown_include_parent(self):
         chown('~/tmp/*', include_parent=True)
@@ -188,15 +201,13 @@ class TestChownGlob(unittest.TestCase):
         for path in self.path.glob_data:
             if path.kwargs.get('is_dir', False) is True:
                 self.os_chown.assert_any_call(path.as_posix(), 9753, 1357)
-                path.is_dir.assert_called()
-                path.is_file.assert_not_called()
             elif path.kwargs.get('is_file', False) is True:
                 self.os_chown.assert_any_call(path.as_posix(), 9753, 1357)
-                path.is_dir.assert_called()
-                path.is_file.assert_called()
             else:
-                path.is_dir.assert_called()
-                path.is_file.assert_called()
+                self.assertNotIn(
+                    path.as_posix(),
+                    [args[0] for args, _ in self.os_chown.call_args_list]
+                )
         self.os_chown.assert_any_call(self.path.parent.as_posix(), 9753, 1357)
 
 
@@ -217,12 +228,19 @@ class TestChownEmptyGlob(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # Mock the pathlib.Path() return value
+        # Mock the flutils.pathutils._iter_glob() return value
         patcher = patch(
-            'flutils.pathutils.Path',
-            return_value=self.path
+            'flutils.pathutils._iter_glob',
+            return_value=[
+                (
+                    path.as_posix(),
+                    path.kwargs.get('is_dir', False),
+                    path.kwargs.get('is_file', False),
+                )
+                for path in self.path.glob_data
+            ]
         )
-        self.path_func = patcher.start()
+        self.iter_glob = patcher.start()
         self.addCleanup(patcher.stop)
 
         # Mock the flutils.pathutils.get_os_user() return value
@@ -252,6 +270,7 @@ class TestChownEmptyGlob(unittest.TestCase):
     def test_chown_empty_glob(self):
         chown('~/**')
         self.normalize_path.assert_called_with('~/**')
+        self.iter_glob.assert_called_with('/home/test_user/**')
         self.get_os_user.assert_called_with(None)
         self.get_os_group.assert_called_with(None)
         self.os_chown.assert_not_called()
@@ -49,9 +49,9 @@ class TestDirectoryPresent(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 '',
                 '',
@@ -62,6 +62,14 @@ class TestDirectoryPresent(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -78,16 +86,34 @@ class TestDirectoryPresent(unittest.TestCase):
         self.chmod = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the _get_uid_gid() function.
+        patcher = patch(
+            'flutils.pathutils._get_uid_gid',
+            return_value=(9753, 1357)
+        )
+        self.get_uid_gid = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # patch the os.chown() function.
+        patcher = patch(
+            'flutils.pathutils.os.chown',
+            return_value=None
+        )
+        self.os_chown = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_directory_present_with_parents_default(self):
         directory_present(self.path.as_posix())
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_called_with(mode=0o700)
-        self.dir_two.mkdir.assert_called_with(mode=0o700)
-        self.dir_one.mkdir.assert_called_with(mode=0o700)
-        self.tmp.mkdir.assert_not_called()
-        self.chown.assert_any_call(self.path, user=None, group=None)
-        self.chown.assert_any_call(self.dir_two, user=None, group=None)
-        self.chown.assert_any_call(self.dir_one, user=None, group=None)
+        self.os_mkdir.assert_any_call(self.path.as_posix(), 0o700)
+        self.os_mkdir.assert_any_call(self.dir_two.as_posix(), 0o700)
+        self.os_mkdir.assert_any_call(self.dir_one.as_posix(), 0o700)
+        self.assertEqual(self.os_mkdir.call_count, 3)
+        self.get_uid_gid.assert_called_once_with(None, None)
+        self.os_chown.assert_any_call(self.path.as_posix(), 9753, 1357)
+        self.os_chown.assert_any_call(self.dir_two.as_posix(), 9753, 1357)
+        self.os_chown.assert_any_call(self.dir_one.as_posix(), 9753, 1357)
+        self.chown.assert_not_called()
         self.chmod.assert_not_called()
 
     def test_directory_present_with_parents_mode_user_group(self):
@@ -101,13 +127,15 @@ class TestDirectoryPresent(unittest.TestCase):
             group=group
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_called_with(mode=mode)
-        self.dir_two.mkdir.assert_called_with(mode=mode)
-        self.dir_one.mkdir.assert_called_with(mode=mode)
-        self.tmp.mkdir.assert_not_called()
-        self.chown.assert_any_call(self.path, user=user, group=group)
-        self.chown.assert_any_call(self.dir_two, user=user, group=group)
-        self.chown.assert_any_call(self.dir_one, user=user, group=group)
+        self.os_mkdir.assert_any_call(self.path.as_posix(), mode)
+        self.os_mkdir.assert_any_call(self.dir_two.as_posix(), mode)
+        self.os_mkdir.assert_any_call(self.dir_one.as_posix(), mode)
+        self.assertEqual(self.os_mkdir.call_count, 3)
+        self.get_uid_gid.assert_called_once_with(user, group)
+        self.os_chown.assert_any_call(self.path.as_posix(), 9753, 1357)
+        self.os_chown.assert_any_call(self.dir_two.as_posix(), 9753, 1357)
+        self.os_chown.assert_any_call(self.dir_one.as_posix(), 9753, 1357)
+        self.chown.assert_not_called()
         self.chmod.assert_not_called()
 
 
@@ -154,9 +182,9 @@ class TestDirectoryPresentExisting(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 'directory',
                 'directory',
@@ -167,6 +195,14 @@ class TestDirectoryPresentExisting(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -186,10 +222,7 @@ class TestDirectoryPresentExisting(unittest.TestCase):
     def test_directory_present_exists(self):
         directory_present(self.path.as_posix())
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.dir_two.mkdir.assert_not_called()
-        self.dir_one.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_called_once_with(self.path, mode_dir=0o700)
         self.chown.assert_called_once_with(self.path, user=None, group=None)
 
@@ -237,9 +270,9 @@ class TestDirectoryPresentGlobError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 '',
                 'directory',
@@ -250,6 +283,14 @@ class TestDirectoryPresentGlobError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -269,10 +310,7 @@ class TestDirectoryPresentGlobError(unittest.TestCase):
     def test_directory_present_glob_error(self):
         self.assertRaises(ValueError, directory_present, self.path.as_posix())
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.dir_two.mkdir.assert_not_called()
-        self.dir_one.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -293,9 +331,9 @@ class TestDirectoryPresentAbsoluteError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 '',
                 ''
@@ -304,6 +342,14 @@ class TestDirectoryPresentAbsoluteError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -323,7 +369,7 @@ class TestDirectoryPresentAbsoluteError(unittest.TestCase):
     def test_directory_present_absolute_error(self):
         self.assertRaises(ValueError, directory_present, self.path.as_posix())
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -355,9 +401,9 @@ class TestDirectoryPresentFileError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 'file',
                 'directory'
@@ -366,6 +412,14 @@ class TestDirectoryPresentFileError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -389,8 +443,7 @@ class TestDirectoryPresentFileError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -422,9 +475,9 @@ class TestDirectoryPresentBlockDeviceError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple values.
+        # patch the _exists_as() function to return multiple values.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 'block device',
                 'directory'
@@ -433,6 +486,14 @@ class TestDirectoryPresentBlockDeviceError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -456,8 +517,7 @@ class TestDirectoryPresentBlockDeviceError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -489,9 +549,9 @@ class TestDirectoryPresentCharDeviceError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple values.
+        # patch the _exists_as() function to return multiple values.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 'char device',
                 'directory'
@@ -500,6 +560,14 @@ class TestDirectoryPresentCharDeviceError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -523,8 +591,7 @@ class TestDirectoryPresentCharDeviceError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -558,7 +625,7 @@ class TestDirectoryPresentFifoError(unittest.TestCase):
 
         # patch the exists_as() function to return mutiple values.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 'FIFO',
                 'directory'
@@ -567,6 +634,14 @@ class TestDirectoryPresentFifoError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -590,8 +665,7 @@ class TestDirectoryPresentFifoError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -623,9 +697,9 @@ class TestDirectoryPresentSocketError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple values.
+        # patch the _exists_as() function to return multiple values.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 'socket',
                 'directory'
@@ -634,6 +708,14 @@ class TestDirectoryPresentSocketError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -657,8 +739,7 @@ class TestDirectoryPresentSocketError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -689,9 +770,9 @@ class TestDirectoryPresentParentFileError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 '',
                 'file'
@@ -700,6 +781,14 @@ class TestDirectoryPresentParentFileError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -723,8 +812,7 @@ class TestDirectoryPresentParentFileError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -755,9 +843,9 @@ class TestDirectoryPresentParentBlockDeviceError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 '',
                 'block device'
@@ -766,6 +854,14 @@ class TestDirectoryPresentParentBlockDeviceError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -789,8 +885,7 @@ class TestDirectoryPresentParentBlockDeviceError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -821,9 +916,9 @@ class TestDirectoryPresentParentCharDeviceError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 '',
                 'char device'
@@ -832,6 +927,14 @@ class TestDirectoryPresentParentCharDeviceError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -855,8 +958,7 @@ class TestDirectoryPresentParentCharDeviceError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -887,9 +989,9 @@ class TestDirectoryPresentParentFifoError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 '',
                 'FIFO'
@@ -898,6 +1000,14 @@ class TestDirectoryPresentParentFifoError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -921,8 +1031,7 @@ class TestDirectoryPresentParentFifoError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
 
@@ -953,9 +1062,9 @@ class TestDirectoryPresentParentSocketError(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-        # patch the exists_as() function to return multiple results.
+        # patch the _exists_as() function to return multiple results.
         patcher = patch(
-            'flutils.pathutils.exists_as',
+            'flutils.pathutils._exists_as',
             side_effect=[
                 '',
                 'socket'
@@ -964,6 +1073,14 @@ class TestDirectoryPresentParentSocketError(unittest.TestCase):
         self.exists_as = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # patch the os.mkdir() function.
+        patcher = patch(
+            'flutils.pathutils.os.mkdir',
+            return_value=None
+        )
+        self.os_mkdir = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # patch the chown() function.
         patcher = patch(
             'flutils.pathutils.chown',
@@ -987,7 +1104,6 @@ class TestDirectoryPresentParentSocketError(unittest.TestCase):
             self.path.as_posix()
         )
         self.normalize_path.assert_called_with(self.path.as_posix())
-        self.path.mkdir.assert_not_called()
-        self.tmp.mkdir.assert_not_called()
+        self.os_mkdir.assert_not_called()
         self.chmod.assert_not_called()
         self.chown.assert_not_called()
@@ -1,4 +1,6 @@
+import stat
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from flutils.pathutils import exists_as
@@ -10,10 +12,16 @@ class TestExistsAsDirectory(unittest.TestCase):
 
     def setUp(self):
 
-        self.path = PosixPathMock(
-            '/home/test_user/directory',
-            is_dir=True
+        self.path = PosixPathMock('/home/test_user/directory')
+
+        # Patch os.stat() to return the st_mode of the file type
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            return_value=SimpleNamespace(st_mode=stat.S_IFDIR | 0o644)
         )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Patch normalize_path() to return self.path
         patcher = patch(
             'flutils.pathutils.normalize_path',
@@ -32,10 +40,16 @@ class TestExistsAsFile(unittest.TestCase):
 
     def setUp(self):
 
-        self.path = PosixPathMock(
-            '/home/test_user/file',
-            is_file=True
+        self.path = PosixPathMock('/home/test_user/file')
+
+        # Patch os.stat() to return the st_mode of the file type
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            return_value=SimpleNamespace(st_mode=stat.S_IFREG | 0o644)
         )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Patch normalize_path() to return self.path
         patcher = patch(
             'flutils.pathutils.normalize_path',
@@ -54,10 +68,16 @@ class TestExistsAsBlockDevice(unittest.TestCase):
 
     def setUp(self):
 
-        self.path = PosixPathMock(
-            '/home/test_user/block_device',
-            is_block_device=True
+        self.path = PosixPathMock('/home/test_user/block_device')
+
+        # Patch os.stat() to return the st_mode of the file type
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            return_value=SimpleNamespace(st_mode=stat.S_IFBLK | 0o644)
         )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Patch normalize_path() to return self.path
         patcher = patch(
             'flutils.pathutils.normalize_path',
@@ -76,10 +96,16 @@ class TestExistsAsCharDevice(unittest.TestCase):
 
     def setUp(self):
 
-        self.path = PosixPathMock(
-            '/home/test_user/char_device',
-            is_char_device=True
+        self.path = PosixPathMock('/home/test_user/char_device')
+
+        # Patch os.stat() to return the st_mode of the file type
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            return_value=SimpleNamespace(st_mode=stat.S_IFCHR | 0o644)
         )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Patch normalize_path() to return self.path
         patcher = patch(
             'flutils.pathutils.normalize_path',
@@ -98,10 +124,16 @@ class TestExistsAsFifo(unittest.TestCase):
 
     def setUp(self):
 
-        self.path = PosixPathMock(
-            '/home/test_user/fifo',
-            is_fifo=True
+        self.path = PosixPathMock('/home/test_user/fifo')
+
+        # Patch os.stat() to return the st_mode of the file type
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            return_value=SimpleNamespace(st_mode=stat.S_IFIFO | 0o644)
         )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Patch normalize_path() to return self.path
         patcher = patch(
             'flutils.pathutils.normalize_path',
@@ -120,10 +152,16 @@ class TestExistsAsSocket(unittest.TestCase):
 
     def setUp(self):
 
-        self.path = PosixPathMock(
-            '/home/test_user/socket',
-            is_socket=True
+        self.path = PosixPathMock('/home/test_user/socket')
+
+        # Patch os.stat() to return the st_mode of the file type
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            return_value=SimpleNamespace(st_mode=stat.S_IFSOCK | 0o644)
         )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Patch normalize_path() to return self.path
         patcher = patch(
             'flutils.pathutils.normalize_path',
@@ -143,6 +181,15 @@ class TestExistsAsEmpty(unittest.TestCase):
     def setUp(self):
 
         self.path = PosixPathMock('/home/test_user/empty')
+
+        # Patch os.stat() to raise FileNotFoundError
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            side_effect=FileNotFoundError(2, 'No such file or directory')
+        )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Patch normalize_path() to return self.path
         patcher = patch(
             'flutils.pathutils.normalize_path',
@@ -151,7 +198,34 @@ class TestExistsAsEmpty(unittest.TestCase):
         self.normalize_path = patcher.start()
         self.addCleanup(patcher.stop)
 
-    def test_exists_as_socket(self):
+    def test_exists_as_empty(self):
         path_type = exists_as(self.path.as_posix())
         self.normalize_path.assert_called_with(self.path.as_posix())
         self.assertEqual(path_type, '')
+
+
+class TestExistsAsPermissionError(unittest.TestCase):
+
+    def setUp(self):
+
+        self.path = PosixPathMock('/home/test_user/no_access/file')
+
+        # Patch os.stat() to raise PermissionError
+        patcher = patch(
+            'flutils.pathutils.os.stat',
+            side_effect=PermissionError(13, 'Permission denied')
+        )
+        self.os_stat = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Patch normalize_path() to return self.path
+        patcher = patch(
+            'flutils.pathutils.normalize_path',
+            return_value=self.path
+        )
+        self.normalize_path = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_exists_as_permission_error(self):
+        with self.assertRaises(PermissionError):
+            exists_as(self.path.as_posix())
@@ -2,12 +2,24 @@ import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from flutils.pathutils import get_os_group
+# noinspection PyProtectedMember
+from flutils.pathutils import (
+    _getgrgid,
+    _getgrnam,
+    get_os_group,
+)
 
 
 class TestGetOsGroup(unittest.TestCase):
 
     def setUp(self):
+
+        # Make sure the lookups are not coming from the cache.
+        _getgrgid.cache_clear()
+        self.addCleanup(_getgrgid.cache_clear)
+        _getgrnam.cache_clear()
+        self.addCleanup(_getgrnam.cache_clear)
+
         # Mock get_os_user
         patcher = patch(
             'flutils.pathutils.get_os_user',
@@ -55,6 +67,13 @@ class TestGetOsGroup(unittest.TestCase):
 class TestGetOsGroupException(unittest.TestCase):
 
     def setUp(self):
+
+        # Make sure the lookups are not coming from the cache.
+        _getgrgid.cache_clear()
+        self.addCleanup(_getgrgid.cache_clear)
+        _getgrnam.cache_clear()
+        self.addCleanup(_getgrnam.cache_clear)
+
         # Mock get_os_user
         patcher = patch(
             'flutils.pathutils.get_os_user',
@@ -2,13 +2,24 @@ import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from flutils.pathutils import get_os_user
+# noinspection PyProtectedMember
+from flutils.pathutils import (
+    _getpwnam,
+    _getpwuid,
+    get_os_user,
+)
 
 
 class TestGetOsUser(unittest.TestCase):
 
     def setUp(self):
 
+        # Make sure the lookups are not coming from the cache.
+        _getpwnam.cache_clear()
+        self.addCleanup(_getpwnam.cache_clear)
+        _getpwuid.cache_clear()
+        self.addCleanup(_getpwuid.cache_clear)
+
         # Mock pwd.getpwuid
         patcher = patch(
             'flutils.pathutils.pwd.getpwuid',
@@ -46,6 +57,20 @@ class TestGetOsUser(unittest.TestCase):
         self.getuser.assert_not_called()
         self.getpwnam.assert_called_with('test_user')
 
+    def test_get_os_user_cached(self):
+        get_os_user('test_user')
+        user_obj = get_os_user('test_user')
+        self.assertEqual(user_obj.pw_name, 'test_user')
+        self.getpwnam.assert_called_once_with('test_user')
+
+    def test_get_os_user_name_is_none_not_cached(self):
+        # The login name comes from the environment; so, it is looked up
+        # on every call.
+        get_os_user()
+        get_os_user()
+        self.assertEqual(self.getuser.call_count, 2)
+        self.getpwnam.assert_called_once_with('test_user')
+
     def test_get_os_user_uid(self):
         user_obj = get_os_user(254)
         self.assertEqual(user_obj.pw_name, 'uid_user')
@@ -57,6 +82,13 @@ class TestGetOsUser(unittest.TestCase):
 class TestGetOsUserException(unittest.TestCase):
 
     def setUp(self):
+
+        # Make sure the lookups are not coming from the cache.
+        _getpwnam.cache_clear()
+        self.addCleanup(_getpwnam.cache_clear)
+        _getpwuid.cache_clear()
+        self.addCleanup(_getpwuid.cache_clear)
+
         # Mock pwd.getpwuid
         patcher = patch(
             'flutils.pathutils.pwd.getpwuid',
@@ -2,7 +2,11 @@ import sys
 import unittest
 from unittest.mock import patch
 
-from flutils.pathutils import normalize_path
+# noinspection PyProtectedMember
+from flutils.pathutils import (
+    _normalize_absolute_path,
+    normalize_path,
+)
 
 from ..mocks.pathlib import (
     Path,
@@ -14,6 +18,10 @@ class TestNormalizePath(unittest.TestCase):
 
     def setUp(self):
 
+        # Make sure the results are not coming from the cache.
+        _normalize_absolute_path.cache_clear()
+        self.addCleanup(_normalize_absolute_path.cache_clear)
+
         self.path = PosixPathMock('~/tmp/foo/../$TEST')
 
         # Mock pathlib.Path.expanduser
@@ -102,6 +110,10 @@ class TestNormalizePathCwd(unittest.TestCase):
 
     def setUp(self):
 
+        # Make sure the results are not coming from the cache.
+        _normalize_absolute_path.cache_clear()
+        self.addCleanup(_normalize_absolute_path.cache_clear)
+
         self.path = PosixPathMock('foo/../$TEST')
 
         # Mock pathlib.Path.expanduser
@@ -174,3 +186,28 @@ class TestNormalizePathCwd(unittest.TestCase):
         self.join.assert_called_once_with('/home/test_user/tmp', 'foo/../test')
         self.normpath.assert_called_with('/home/test_user/tmp/foo/../test')
         self.assertEqual(path.as_posix(), '/home/test_user/tmp/test')
+
+
+class TestNormalizePathCache(unittest.TestCase):
+
+    def setUp(self):
+        _normalize_absolute_path.cache_clear()
+        self.addCleanup(_normalize_absolute_path.cache_clear)
+
+    def test_normalize_path_cached(self):
+        path = normalize_path('/home/test_user/tmp/foo/../test')
+        self.assertIs(normalize_path('/home/test_user/tmp/foo/../test'), path)
+        self.assertEqual(path.as_posix(), '/home/test_user/tmp/test')
+
+    def test_normalize_path_relative_not_cached(self):
+        patcher = patch(
+            'flutils.pathutils.os.getcwd',
+            return_value='/home/test_user/tmp'
+        )
+        getcwd = patcher.start()
+        self.addCleanup(patcher.stop)
+        path = normalize_path('foo')
+        self.assertEqual(path.as_posix(), '/home/test_user/tmp/foo')
+        getcwd.return_value = '/home/test_user'
+        path = normalize_path('foo')
+        self.assertEqual(path.as_posix(), '/home/test_user/foo')
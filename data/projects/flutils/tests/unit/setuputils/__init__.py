@@ -1,55 +1,36 @@
 import unittest
 from typing import (
-    ClassVar,
     Dict,
     List,
-    Tuple,
     Type,
 )
-from unittest.mock import (
-    Mock,
-    patch,
-)
+from unittest.mock import patch
 
 from setuptools import Command
 
 from flutils.setuputils import add_setup_cfg_commands
 from flutils.setuputils.cfg import SetupCfgCommandConfig
-from flutils.setuputils.cmd import (
-    _finalize_options,
-    _initialize_options,
-    _run,
-)
+# noinspection PyProtectedMember
+from flutils.setuputils.cmd import _SetupCfgCommand
 
 
 def _build_class(
         setup_command_cfg: SetupCfgCommandConfig
 ) -> Type[Command]:
-    setup_klass = type(
-        'SetupCfgCommand',
-        (object,),
+    klass_name = '%sCommand' % setup_command_cfg.camel
+    klass = type(
+        klass_name,
+        (_SetupCfgCommand,),
         {
-            '__annotations__': {
-                'name': ClassVar[str],
-                'root_path': ClassVar[str],
-                'description': ClassVar[str],
-                'user_options': ClassVar[List[str]],
-                'commands': ClassVar[Tuple[str, ...]],
-            },
             '__module__': __name__,
             '__doc__': None,
             'name': setup_command_cfg.name,
-            'root_path': '',
             'description': setup_command_cfg.description,
             'user_options': [],
             'commands': setup_command_cfg.commands,
-            'initialize_options': _initialize_options,
-            'finalize_options': _finalize_options,
-            'run': _run,
+            'parallel': setup_command_cfg.parallel,
         }
     )
-    klass_name = '%sCommand' % setup_command_cfg.camel
-    klass = type(klass_name, (setup_klass, Command), {})
     return klass
 
 
@@ -1,11 +1,17 @@
+import stat
 import unittest
 from configparser import (
     ConfigParser,
     NoOptionError,
     NoSectionError,
 )
-from typing import List
+from types import SimpleNamespace
+from typing import (
+    List,
+    Tuple,
+)
 from unittest.mock import (
+    MagicMock,
     Mock,
     PropertyMock,
     patch,
@@ -17,6 +23,7 @@ from flutils.setuputils.cfg import (
     _each_setup_cfg_command,
     _each_setup_cfg_command_section,
     _get_name,
+    _get_parallel,
     _prep_setup_dir,
     _validate_setup_dir,
     each_sub_command_config,
@@ -62,36 +69,37 @@ class TestCfg(unittest.TestCase):
             'section_1',
             'section_2',
             'metadata',
+            'setup.command.',
             'setup.command.lint',
             'setup.command.a_command',
             'setup.command.missing',
             'setup.command.multi'
         ])
-        type(parser).options = Mock(side_effect=[
-            # parser.options('setup.command.lint')
-            ['description', 'command'],
-            # parser.options('setup.command.a_command')
-            ['name', 'commands'],
-            # parser.options('setup.command.missing')
-            ['description'],
-            # parser.options('setup.command.multi')
-            ['command', 'commands'],
-
-        ])
-        type(parser).get = Mock(side_effect=[
-            # parser.get('setup.command.lint', 'command')
-            'linter {setup_dir} {home} {name}',
-            # parser.get('setup.command.lint', 'description')
-            'Verify {name} {setup_dir} {home}',
-            # parser.get('setup.command.a_command', 'commands')
-            '\nlinter {setup_dir} {home} {name}\nstyler {'
-            'setup_dir}\nanother-command',
-            # parser.get('setup.command.a_command', 'name')
-            '{name}-style',
-            # parser.get('setup.command.multi', 'command')
-            'first',
-            # parser.get('setup.command.multi', 'commands')
-            '\nsecond\nthird',
+        type(parser).items = Mock(side_effect=[
+            # parser.items('setup.command.lint', raw=True)
+            [
+                ('description', 'Verify {name} {setup_dir} {home}'),
+                ('command', 'linter {setup_dir} {home} {name}'),
+            ],
+            # parser.items('setup.command.a_command', raw=True)
+            [
+                ('name', '{name}-style'),
+                (
+                    'commands',
+                    '\nlinter {setup_dir} {home} {name}\nstyler {'
+                    'setup_dir}\nanother-command'
+                ),
+            ],
+            # parser.items('setup.command.missing', raw=True)
+            [
+                ('description', 'This command is missing commands'),
+            ],
+            # parser.items('setup.command.multi', raw=True)
+            [
+                ('command', 'first'),
+                ('commands', '\nsecond\nthird'),
+                ('parallel', 'yes'),
+            ],
         ])
         self.parser = parser
 
@@ -153,7 +161,7 @@ class TestCfg(unittest.TestCase):
         self.addCleanup(patcher.stop)
 
         ret = list(_each_setup_cfg_command(self.parser, self.kwargs))
-        self.parser.options.assert_any_call('setup.command.multi')
+        self.parser.items.assert_any_call('setup.command.multi', raw=True)
         ret_msg = self._obj_for_msg(ret)
         exp = [
             SetupCfgCommandConfig(
@@ -190,7 +198,8 @@ class TestCfg(unittest.TestCase):
                     'first',
                     'second',
                     'third',
-                )
+                ),
+                parallel=True
             ),
         ]
         exp_msg = self._obj_for_msg(exp)
@@ -207,6 +216,13 @@ class TestCfg(unittest.TestCase):
             ).format(exp_msg=exp_msg, ret_msg=ret_msg)
         )
 
+    def test_get_parallel(self) -> None:
+        self.assertFalse(_get_parallel('a', {}))
+        self.assertFalse(_get_parallel('a', {'parallel': 'off'}))
+        self.assertTrue(_get_parallel('a', {'parallel': ' True '}))
+        with self.assertRaises(ValueError):
+            _get_parallel('a', {'parallel': 'sometimes'})
+
     def test_get_name__0(self) -> None:
         parser = Mock(spec=ConfigParser)
         type(parser).get = Mock(return_value=self.kwargs['name'])
@@ -242,31 +258,61 @@ class TestCfg(unittest.TestCase):
         with self.assertRaises(LookupError):
             _get_name(parser, self.path)
 
+    def _patch_validate_setup_dir(
+            self,
+            st_mode: int = stat.S_IFDIR | 0o755,
+            files: Tuple[str, ...] = ('setup.py', 'setup.cfg')
+    ) -> None:
+        patcher = patch(
+            'flutils.setuputils.cfg.os.stat',
+            return_value=SimpleNamespace(st_mode=st_mode)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        entries = []
+        for name in ('setup.py', 'setup.cfg', 'README.rst'):
+            entry = Mock()
+            entry.name = name
+            entry.is_file = Mock(return_value=name in files)
+            entries.append(entry)
+        scandir = MagicMock()
+        scandir.__enter__.return_value = iter(entries)
+        patcher = patch(
+            'flutils.setuputils.cfg.os.scandir',
+            return_value=scandir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_validate_setup_dir__0(self) -> None:
+        patcher = patch(
+            'flutils.setuputils.cfg.os.stat',
+            side_effect=FileNotFoundError(2, 'No such file or directory')
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
         with self.assertRaises(FileNotFoundError):
-            with patch('os.path.exists', return_value=False):
-                _validate_setup_dir('/a/path')
+            _validate_setup_dir('/a/path')
 
     def test_validate_setup_dir__1(self) -> None:
+        self._patch_validate_setup_dir(st_mode=stat.S_IFREG | 0o644)
         with self.assertRaises(NotADirectoryError):
-            with patch('os.path.exists', return_value=True):
-                with patch('os.path.isdir', return_value=False):
-                    _validate_setup_dir('/a/path')
+            _validate_setup_dir('/a/path')
 
     def test_validate_setup_dir__2(self) -> None:
+        self._patch_validate_setup_dir(files=('setup.cfg',))
         with self.assertRaises(FileNotFoundError):
-            with patch('os.path.exists', return_value=True):
-                with patch('os.path.isdir', return_value=True):
-                    with patch('os.path.isfile', return_value=False):
-                        _validate_setup_dir('/a/path')
+            _validate_setup_dir('/a/path')
 
     def test_validate_setup_dir__3(self) -> None:
-        values = [True, False]
+        self._patch_validate_setup_dir(files=('setup.py',))
         with self.assertRaises(FileNotFoundError):
-            with patch('os.path.exists', return_value=True):
-                with patch('os.path.isdir', return_value=True):
-                    with patch('os.path.isfile', side_effect=values):
-                        _validate_setup_dir('/a/path')
+            _validate_setup_dir('/a/path')
+
+    def test_validate_setup_dir__4(self) -> None:
+        self._patch_validate_setup_dir()
+        self.assertIsNone(_validate_setup_dir('/a/path'))
 
     def test_prep_setup_dir__0(self) -> None:
         exp = '/a/dir'
@@ -284,14 +330,15 @@ class TestCfg(unittest.TestCase):
             )
 
     def test_prep_setup_dir__1(self) -> None:
-        frame_summary = Mock()
-        type(frame_summary).filename = PropertyMock(
+        frame = Mock()
+        type(frame.f_code).co_filename = PropertyMock(
             return_value='/a/dir/path/setup.py'
         )
+        frame.f_back = None
 
         patcher = patch(
-            'flutils.setuputils.cfg.extract_stack',
-            return_value=[frame_summary]
+            'flutils.setuputils.cfg._getframe',
+            return_value=frame
         )
         patcher.start()
         self.addCleanup(patcher.stop)
@@ -315,14 +362,15 @@ class TestCfg(unittest.TestCase):
         self.assertEqual(ret, exp)
 
     def test_prep_setup_dir__2(self) -> None:
-        frame_summary = Mock()
-        type(frame_summary).filename = PropertyMock(
+        frame = Mock()
+        type(frame.f_code).co_filename = PropertyMock(
             return_value='/a/dir/path/a.py'
         )
+        frame.f_back = None
 
         patcher = patch(
-            'flutils.setuputils.cfg.extract_stack',
-            return_value=[frame_summary]
+            'flutils.setuputils.cfg._getframe',
+            return_value=frame
         )
         patcher.start()
         self.addCleanup(patcher.stop)
@@ -330,6 +378,43 @@ class TestCfg(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             _prep_setup_dir()
 
+    def test_prep_setup_dir__3(self) -> None:
+        outer = Mock()
+        type(outer.f_code).co_filename = PropertyMock(
+            return_value='/a/dir/path/setup.py'
+        )
+        outer.f_back = None
+        inner = Mock()
+        type(inner.f_code).co_filename = PropertyMock(
+            return_value='/another/dir/setup.py'
+        )
+        inner.f_back = outer
+
+        patcher = patch(
+            'flutils.setuputils.cfg._getframe',
+            return_value=inner
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch(
+            'flutils.setuputils.cfg._validate_setup_dir',
+            return_value=None
+        )
+        validate_setup_dir = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch(
+            'flutils.setuputils.cfg.os.path.realpath',
+            side_effect=lambda x: x
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        ret = _prep_setup_dir()
+        self.assertEqual(ret, '/a/dir/path')
+        validate_setup_dir.assert_called_once_with('/a/dir/path')
+
     def test_each_sub_command_config(self) -> None:
 
         # prep_setup_dir
@@ -1,6 +1,6 @@
 import os
 import unittest
-from subprocess import PIPE
+from io import StringIO
 from unittest.mock import (
     ANY,
     Mock,
@@ -9,10 +9,13 @@ from unittest.mock import (
     patch,
 )
 
+from setuptools import Command
+
 from flutils.setuputils.cfg import SetupCfgCommandConfig
 # noinspection PyProtectedMember
 from flutils.setuputils.cmd import (
     _DIVIDER,
+    _SetupCfgCommand,
     _each_command,
     _finalize_options,
     _get_path,
@@ -25,6 +28,9 @@ from flutils.setuputils.cmd import (
 
 class TestCmd(unittest.TestCase):
 
+    def setUp(self) -> None:
+        _get_path.cache_clear()
+        self.addCleanup(_get_path.cache_clear)
 
     @patch('flutils.setuputils.cmd.os.access', return_value=True)
     @patch('flutils.setuputils.cmd.os.path.isfile', return_value=True)
@@ -88,6 +94,16 @@ class TestCmd(unittest.TestCase):
             _get_path(arg)
         which.assert_called_once_with(arg)
 
+    @patch('flutils.setuputils.cmd.os.access', return_value=True)
+    @patch('flutils.setuputils.cmd.shutil.which', return_value='/a/path/to/ls')
+    def test_get_path__5(self, which, access) -> None:
+        arg = 'ls'
+        exp = '/a/path/to/ls'
+        self.assertEqual(_get_path(arg), exp)
+        self.assertEqual(_get_path(arg), exp)
+        which.assert_called_once_with(arg)
+        access.assert_called_once_with(exp, os.X_OK)
+
     def test_each_command(self) -> None:
         arg = (
             '/a/path/to/ls -flap ',
@@ -188,11 +204,6 @@ class TestCmd(unittest.TestCase):
         commands = PropertyMock(return_value=cmds)
         type(_self).commands = commands
 
-        patcher = patch('flutils.setuputils.cmd.sys', autospec=True)
-        sys = patcher.start()
-        sys.exit.return_value = None
-        self.addCleanup(patcher.stop)
-
         patcher = patch(
             'flutils.setuputils.cmd._each_command',
             return_value=cmds
@@ -211,7 +222,7 @@ class TestCmd(unittest.TestCase):
         run = patcher.start()
         self.addCleanup(patcher.stop)
 
-        _run(_self)
+        self.assertIsNone(_run(_self))
 
         each_command.assert_called_once_with(cmds)
         show_command.assert_has_calls([
@@ -222,7 +233,6 @@ class TestCmd(unittest.TestCase):
             call(cmds[0]),
             call(cmds[1])
         ])
-        sys.exit.assert_called_once_with(0)
 
     def test_run__1(self) -> None:
         cmds = (
@@ -243,11 +253,6 @@ class TestCmd(unittest.TestCase):
         commands = PropertyMock(return_value=cmds)
         type(_self).commands = commands
 
-        patcher = patch('flutils.setuputils.cmd.sys', autospec=True)
-        sys = patcher.start()
-        sys.exit.return_value = None
-        self.addCleanup(patcher.stop)
-
         patcher = patch(
             'flutils.setuputils.cmd._each_command',
             return_value=cmds
@@ -266,7 +271,9 @@ class TestCmd(unittest.TestCase):
         run = patcher.start()
         self.addCleanup(patcher.stop)
 
-        _run(_self)
+        with self.assertRaises(SystemExit) as cm:
+            _run(_self)
+        self.assertEqual(cm.exception.code, 5)
 
         each_command.assert_called_once_with(cmds)
         show_command.assert_has_calls([
@@ -277,7 +284,74 @@ class TestCmd(unittest.TestCase):
             call(cmds[0]),
             call(cmds[1])
         ])
-        sys.exit.assert_called_once_with(5)
+
+    def _patch_run_parallel(self, cmds, vals):
+        _self = Mock()
+        type(_self).commands = PropertyMock(return_value=cmds)
+        type(_self).parallel = PropertyMock(return_value=True)
+
+        patcher = patch(
+            'flutils.setuputils.cmd._each_command',
+            return_value=iter(cmds)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch('flutils.setuputils.cmd._show_command')
+        show_command = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        def _run_command(command, stdout=None, stderr=None):
+            stdout.write(b'%s\n' % command[0].encode())
+            return vals[command[0]]
+
+        patcher = patch(
+            'flutils.setuputils.cmd.run',
+            side_effect=_run_command
+        )
+        run = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch('flutils.setuputils.cmd.sys.stdout', new=StringIO())
+        stdout = patcher.start()
+        self.addCleanup(patcher.stop)
+        return _self, show_command, run, stdout
+
+    def test_run__2(self) -> None:
+        cmds = [
+            ('/a/path/to/ls', '-flap'),
+            ('/a/path/to/test', '-a'),
+        ]
+        _self, show_command, run, stdout = self._patch_run_parallel(
+            cmds,
+            {'/a/path/to/ls': 0, '/a/path/to/test': 0}
+        )
+        self.assertIsNone(_run(_self))
+        show_command.assert_has_calls([
+            call(cmds[0]),
+            call(cmds[1])
+        ])
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(
+            stdout.getvalue(),
+            '/a/path/to/ls\n/a/path/to/test\n'
+        )
+
+    def test_run__3(self) -> None:
+        cmds = [
+            ('/a/path/to/ls', '-flap'),
+            ('/a/path/to/test', '-a'),
+        ]
+        _self, show_command, run, stdout = self._patch_run_parallel(
+            cmds,
+            {'/a/path/to/ls': 3, '/a/path/to/test': 0}
+        )
+        with self.assertRaises(SystemExit) as cm:
+            _run(_self)
+        self.assertEqual(cm.exception.code, 3)
+        # Every command is still run and shown.
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(show_command.call_count, 2)
 
     @staticmethod
     def test_build_sub_command_class() -> None:
@@ -293,7 +367,28 @@ class TestCmd(unittest.TestCase):
         )
         with patch('flutils.setuputils.cmd._type') as type_:
             build_setup_cfg_command_class(arg)
-            type_.assert_has_calls([
-                call('SetupCfgCommand', ANY, ANY),
-                call('MultiCommand', ANY, ANY)
-            ])
+            type_.assert_called_once_with(
+                'MultiCommand',
+                (_SetupCfgCommand,),
+                ANY
+            )
+
+    def test_build_sub_command_class__real(self) -> None:
+        arg = SetupCfgCommandConfig(
+            name='multi',
+            camel='Multi',
+            description='A description',
+            commands=(
+                'first',
+                'second',
+            )
+        )
+        klass = build_setup_cfg_command_class(arg)
+        self.assertEqual(klass.__name__, 'MultiCommand')
+        self.assertTrue(issubclass(klass, Command))
+        self.assertEqual(klass.name, 'multi')
+        self.assertEqual(klass.description, 'A description')
+        self.assertEqual(klass.commands, ('first', 'second'))
+        self.assertFalse(klass.parallel)
+        self.assertIs(klass.run, _run)
+        self.assertIsNot(klass.user_options, _SetupCfgCommand.user_options)